@@ -5,9 +5,22 @@ with null values in brief_description or challenges_problem_statements fields.
 It generates both a detailed analysis file and a simple list of all null project IDs.
 """
 
-import json
 from pathlib import Path
 
+# orjson is optional - parses project_info.json several times faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+
+def sort_project_ids(project_ids):
+    """Sort project IDs numerically (non-numeric IDs sort first, as 0)."""
+    return sorted(project_ids, key=lambda x: int(x) if x.isdigit() else 0)
+
+
 # Get script directory and project info file path
 script_dir = Path(__file__).parent
 project_info_file = script_dir / "project_info.json"
@@ -20,32 +33,42 @@ print("=" * 70)
 print("ANALYZING NULL VALUES IN project_info.json")
 print("=" * 70)
 
-with open(project_info_file, 'r', encoding='utf-8') as f:
-    data = json.load(f)
+if ORJSON_AVAILABLE:
+    data = orjson.loads(project_info_file.read_bytes())
+else:
+    with open(project_info_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
 
 # Analyze null values
 null_brief = []
 null_challenges = []
 null_both = []
-all_nulls = []  # All project IDs with any null
 
 for item in data:
-    project_id = item.get('project_id', 'unknown')
-    brief = item.get('brief_description')
-    challenges = item.get('challenges_problem_statements')
-    
-    has_brief = brief is not None and brief != ""
-    has_challenges = challenges is not None and challenges != ""
+    # None and "" both count as missing
+    has_brief = bool(item.get('brief_description'))
+    has_challenges = bool(item.get('challenges_problem_statements'))
     
+    if has_brief and has_challenges:
+        continue
+    project_id = item.get('project_id', 'unknown')
     if not has_brief and not has_challenges:
         null_both.append(project_id)
-        all_nulls.append(project_id)
     elif not has_brief:
         null_brief.append(project_id)
-        all_nulls.append(project_id)
-    elif not has_challenges:
+    else:
         null_challenges.append(project_id)
-        all_nulls.append(project_id)
+
+# All project IDs with any null (the three lists are disjoint)
+all_nulls = null_brief + null_challenges + null_both
+
+# Sort each list once; the sorted lists are reused for console and file output
+sorted_brief = sort_project_ids(null_brief)
+sorted_challenges = sort_project_ids(null_challenges)
+sorted_both = sort_project_ids(null_both)
+sorted_all_nulls = sort_project_ids(all_nulls)
+# The complete list appears in both output files; build it once
+all_nulls_text = "".join(f"{pid}\n" for pid in sorted_all_nulls)
 
 # Print summary to console
 print(f"\nTotal documents: {len(data)}")
@@ -65,21 +88,21 @@ print(f"{'=' * 70}")
 if null_brief:
     print(f"\n1. Missing brief_description only ({len(null_brief)} projects):")
     print("-" * 70)
-    for i, pid in enumerate(sorted(null_brief, key=lambda x: int(x) if x.isdigit() else 0), 1):
+    for i, pid in enumerate(sorted_brief, 1):
         print(f"   {i:4d}. {pid}")
     print("-" * 70)
 
 if null_challenges:
     print(f"\n2. Missing challenges_problem_statements only ({len(null_challenges)} projects):")
     print("-" * 70)
-    for i, pid in enumerate(sorted(null_challenges, key=lambda x: int(x) if x.isdigit() else 0), 1):
+    for i, pid in enumerate(sorted_challenges, 1):
         print(f"   {i:4d}. {pid}")
     print("-" * 70)
 
 if null_both:
     print(f"\n3. Missing both ({len(null_both)} projects):")
     print("-" * 70)
-    for i, pid in enumerate(sorted(null_both, key=lambda x: int(x) if x.isdigit() else 0), 1):
+    for i, pid in enumerate(sorted_both, 1):
         print(f"   {i:4d}. {pid}")
     print("-" * 70)
 
@@ -100,25 +123,21 @@ with open(output_file, 'w', encoding='utf-8') as f:
     if null_brief:
         f.write(f"\n1. Missing brief_description only ({len(null_brief)} projects):\n")
         f.write("-" * 70 + "\n")
-        for pid in sorted(null_brief, key=lambda x: int(x) if x.isdigit() else 0):
-            f.write(f"{pid}\n")
+        f.write("".join(f"{pid}\n" for pid in sorted_brief))
     
     if null_challenges:
         f.write(f"\n2. Missing challenges_problem_statements only ({len(null_challenges)} projects):\n")
         f.write("-" * 70 + "\n")
-        for pid in sorted(null_challenges, key=lambda x: int(x) if x.isdigit() else 0):
-            f.write(f"{pid}\n")
+        f.write("".join(f"{pid}\n" for pid in sorted_challenges))
     
     if null_both:
         f.write(f"\n3. Missing both ({len(null_both)} projects):\n")
         f.write("-" * 70 + "\n")
-        for pid in sorted(null_both, key=lambda x: int(x) if x.isdigit() else 0):
-            f.write(f"{pid}\n")
+        f.write("".join(f"{pid}\n" for pid in sorted_both))
     
     f.write(f"\n\n4. ALL PROJECT IDs WITH NULL VALUES (Total: {len(all_nulls)}):\n")
     f.write("-" * 70 + "\n")
-    for pid in sorted(all_nulls, key=lambda x: int(x) if x.isdigit() else 0):
-        f.write(f"{pid}\n")
+    f.write(all_nulls_text)
 
 # Also save simple list file (for compatibility with other scripts)
 simple_list_file = script_dir / "all_null_project_ids.txt"
@@ -133,8 +152,7 @@ with open(simple_list_file, 'w', encoding='utf-8') as f:
     f.write("=" * 70 + "\n")
     f.write("COMPLETE LIST (sorted):\n")
     f.write("=" * 70 + "\n")
-    for pid in sorted(all_nulls, key=lambda x: int(x) if x.isdigit() else 0):
-        f.write(f"{pid}\n")
+    f.write(all_nulls_text)
 
 print(f"\n{'=' * 70}")
 print("OUTPUT FILES")
@@ -144,7 +162,6 @@ print(f"Simple list saved to: {simple_list_file}")
 print(f"{'=' * 70}")
 print(f"\nComplete list of all {len(all_nulls)} project IDs with null values:")
 print("-" * 70)
-for pid in sorted(all_nulls, key=lambda x: int(x) if x.isdigit() else 0):
-    print(pid)
+print(all_nulls_text, end='')
 print("-" * 70)
 
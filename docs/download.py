@@ -282,13 +282,41 @@ def project_file_exists(project_id: str, output_path: Path) -> Optional[Path]:
     return None
 
 
-def download_file(url: str, filepath: Path) -> bool:
+def index_existing_project_files(output_path: Path) -> Dict[str, Path]:
+    """
+    Index existing files in the output folder and its scanned folder by project ID.
+    
+    Scans each folder once, so callers checking many projects can do a dict lookup
+    instead of calling project_file_exists (two globs) per project. Files in the
+    main folder take precedence over the scanned folder, as in project_file_exists.
+    
+    Args:
+        output_path: Directory to index
+    
+    Returns:
+        Dictionary mapping project ID to the first matching file path
+    """
+    existing: Dict[str, Path] = {}
+    for folder in (output_path, output_path / "scanned"):
+        if not folder.is_dir():
+            continue
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                # Files are named {project_id}_{rest}
+                project_id, sep, _ = entry.name.partition('_')
+                if sep and project_id not in existing:
+                    existing[project_id] = Path(entry.path)
+    return existing
+
+
+def download_file(url: str, filepath: Path, show_progress: bool = True) -> bool:
     """
     Download a file from a URL and save it.
     
     Args:
         url: URL of the file to download
         filepath: Path where to save the file
+        show_progress: Whether to print a progress line (disable when downloading in parallel)
     
     Returns:
         True if successful, False otherwise
@@ -309,11 +337,12 @@ def download_file(url: str, filepath: Path) -> bool:
                 if chunk:
                     f.write(chunk)
                     downloaded += len(chunk)
-                    if total_size > 0:
+                    if show_progress and total_size > 0:
                         percent = (downloaded / total_size) * 100
                         print(f"\r  Progress: {percent:.1f}%", end='', flush=True)
         
-        print()  # New line after progress
+        if show_progress:
+            print()  # New line after progress
         
         if filepath.exists() and filepath.stat().st_size > 0:
             return True
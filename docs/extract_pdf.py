@@ -37,6 +37,14 @@ try:
 except ImportError:
     PYPDF2_AVAILABLE = False
 
+# orjson is optional - serializes structured info in one C-level pass
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
 # Folder paths based on FOLDER_SOURCE
 if FOLDER_SOURCE == "cloud":
     # Construct paths from base path
@@ -46,6 +54,9 @@ else:  # local
     DEFAULT_PDF_FOLDER = "project docs"
     DEFAULT_TEXT_FOLDER = None  # Will use script_dir / "text" for local
 
+# Write buffer for extracted text files (1 MiB -> fewer, larger writes on cloud paths)
+WRITE_BUFFER_SIZE = 1 << 20
+
 # Global list to track scanned PDFs (store full paths)
 SCANNED_PDFS: List[Path] = []
 
@@ -354,13 +365,33 @@ def save_extracted_text(text: str, output_path: Path) -> None:
     """
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
             f.write(text)
         print(f"  ✓ Saved extracted text to: {output_path}")
     except Exception as e:
         print(f"  ✗ Error saving text: {e}")
 
 
+def save_structured_info(info: Dict[str, any], output_path: Path) -> None:
+    """
+    Save structured information to a JSON file.
+    
+    Args:
+        info: Dictionary returned by extract_structured_info
+        output_path: Path to save JSON file
+    """
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if ORJSON_AVAILABLE:
+            output_path.write_bytes(orjson.dumps(info, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(info, f, indent=2, ensure_ascii=False)
+        print(f"  ✓ Saved structured info to: {output_path}")
+    except Exception as e:
+        print(f"  ⚠ Could not save JSON: {e}")
+
+
 def move_scanned_pdfs(scanned_pdfs: List[Path], scanned_folder: Path) -> None:
     """
     Move scanned PDFs to a scanned folder.
@@ -536,14 +567,7 @@ def process_pdf(pdf_path: str, output_dir: Optional[str] = None, save_text: bool
         save_extracted_text(text, text_output_path)
         
         # Also save structured info as JSON
-        try:
-            import json
-            json_path = text_output_path.with_suffix('.json')
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(info, f, indent=2, ensure_ascii=False)
-            print(f"  ✓ Saved structured info to: {json_path}")
-        except Exception as e:
-            print(f"  ⚠ Could not save JSON: {e}")
+        save_structured_info(info, text_output_path.with_suffix('.json'))
 
 
 if __name__ == "__main__":
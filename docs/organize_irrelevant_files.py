@@ -12,8 +12,10 @@ Only files matching relevant project IDs (1928 projects) are kept in the main fo
 """
 
 import pandas as pd
+import os
 import re
 from pathlib import Path
+from typing import Optional
 import sys
 import shutil
 
@@ -21,29 +23,55 @@ import shutil
 sys.path.insert(0, str(Path(__file__).parent))
 from config import FOLDER_SOURCE, CLOUD_BASE_PATH
 
+# Larger copy buffer for the cross-device fallback in move_file (e.g. OneDrive vs
+# local disk). shutil.copyfile already uses sendfile/fcopyfile/CopyFileW where
+# available; this covers the buffered-copy paths.
+shutil.COPY_BUFSIZE = 1024 * 1024
 
-def extract_project_id(filename):
+# python-calamine is optional - when installed, pandas (2.2+) parses xlsx with it
+# instead of openpyxl, which is much faster on large workbooks
+try:
+    import python_calamine  # noqa: F401
+    PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split('.')[:2])
+    EXCEL_ENGINE = 'calamine' if PANDAS_VERSION >= (2, 2) else 'openpyxl'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
+# pyarrow is optional - when installed, the id/doc columns are read as Arrow-backed
+# strings so the doc = "yes" mask runs on Arrow string kernels
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    STRING_DTYPE = str
+
+# Progress lines from organize_files are buffered and written in batches of this size
+PROGRESS_BATCH_SIZE = 1000
+
+# Project ID patterns for names not in the usual {project_id}_{rest} form
+# Leading digits, with or without an underscore after them
+PROJECT_ID_PATTERN = re.compile(r'^(\d+)')
+# Fallback: any numeric sequence of 5+ digits anywhere in the filename
+LONG_NUMBER_PATTERN = re.compile(r'(\d{5,})')
+
+
+def extract_project_id(basename: str) -> Optional[str]:
     """
-    Extract project ID from filename.
+    Extract project ID from a file name (not a path).
     Files are typically named: {project_id}_{rest_of_name}.txt or .pdf
     """
-    if isinstance(filename, Path):
-        basename = filename.name
-    else:
-        basename = Path(filename).name
+    # Common case: {project_id}_{rest} - plain string split, no regex needed
+    head, sep, _ = basename.partition('_')
+    if sep and head.isdecimal():
+        return head
     
-    # Try to extract project ID from the beginning of filename (format: {project_id}_{rest})
-    match = re.match(r'^(\d+)_', basename)
-    if match:
-        return match.group(1)
-    
-    # Fallback: try to extract numeric ID at the beginning (without underscore)
-    match = re.match(r'^(\d+)', basename)
+    # Fallback: leading digits without the underscore directly after them
+    match = PROJECT_ID_PATTERN.match(basename)
     if match:
         return match.group(1)
     
     # Last resort: try to find any numeric sequence in the filename
-    match = re.search(r'(\d{5,})', basename)
+    match = LONG_NUMBER_PATTERN.search(basename)
     if match:
         return match.group(1)
     
@@ -58,36 +86,39 @@ def get_relevant_project_ids(excel_file: Path) -> set:
         Set of relevant project IDs as strings
     """
     try:
-        df = pd.read_excel(excel_file)
+        # Read only the header first so the data read can be limited to the needed columns
+        columns = list(pd.read_excel(excel_file, nrows=0, engine=EXCEL_ENGINE).columns)
         
         # Check if 'doc' column exists
-        if 'doc' not in df.columns:
+        if 'doc' not in columns:
             print(f"Error: 'doc' column not found in {excel_file}")
-            print(f"Available columns: {list(df.columns)}")
+            print(f"Available columns: {columns}")
             return set()
         
         # Check if 'id' or 'project_id' column exists
         id_column = None
         for col in ['id', 'project_id', 'ID', 'Project ID']:
-            if col in df.columns:
+            if col in columns:
                 id_column = col
                 break
         
         if id_column is None:
             print(f"Error: No project ID column found in {excel_file}")
-            print(f"Available columns: {list(df.columns)}")
+            print(f"Available columns: {columns}")
             return set()
         
+        df = pd.read_excel(excel_file, usecols=[id_column, 'doc'], dtype=STRING_DTYPE, engine=EXCEL_ENGINE)
+        
         # Filter rows where doc = "yes" (case-insensitive)
-        relevant_df = df[df['doc'].astype(str).str.lower().str.strip() == 'yes']
+        mask = df['doc'].str.lower().str.strip().eq('yes')
         
         # Extract project IDs
-        project_ids = relevant_df[id_column].astype(str).str.strip()
-        relevant_ids = set(project_ids.dropna().unique())
+        project_ids = df.loc[mask, id_column].str.strip()
+        relevant_ids = set(project_ids.dropna().unique().tolist())
         
         print(f"Found {len(relevant_ids)} relevant project IDs (doc = 'yes')")
         print(f"Total rows in Excel: {len(df)}")
-        print(f"Rows with doc = 'yes': {len(relevant_df)}")
+        print(f"Rows with doc = 'yes': {int(mask.sum())}")
         
         return relevant_ids
     
@@ -96,6 +127,46 @@ def get_relevant_project_ids(excel_file: Path) -> set:
         return set()
 
 
+def iter_files(root: Path, file_ext: str, recursive: bool = False):
+    """
+    Yield os.DirEntry objects for files under root ending with file_ext.
+    
+    Uses os.scandir so file/dir checks come from the cached directory entry
+    rather than a stat() per file. When recursive, "irrelevant" subfolders
+    are not descended into.
+    """
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive and entry.name != 'irrelevant':
+                        stack.append(entry.path)
+                elif os.path.normcase(entry.name).endswith(file_ext) and entry.is_file():
+                    yield entry
+
+
+def write_messages(messages: list) -> None:
+    """Write buffered progress lines to stdout in a single call and clear the buffer."""
+    if messages:
+        sys.stdout.write('\n'.join(messages) + '\n')
+        messages.clear()
+
+
+def move_file(src: Path, dest: Path) -> None:
+    """
+    Move a file, trying a plain rename first.
+    
+    Path.rename is a single syscall when source and destination are on the same
+    filesystem (the usual case here). shutil.move is only used as a fallback,
+    e.g. for cross-device moves.
+    """
+    try:
+        src.rename(dest)
+    except OSError:
+        shutil.move(str(src), str(dest))
+
+
 def organize_files(source_dir: Path, irrelevant_dir: Path, relevant_ids: set, file_ext: str, recursive: bool = False):
     """
     Move files that don't match relevant project IDs to irrelevant folder.
@@ -114,34 +185,43 @@ def organize_files(source_dir: Path, irrelevant_dir: Path, relevant_ids: set, fi
     # Create irrelevant directory if it doesn't exist
     irrelevant_dir.mkdir(parents=True, exist_ok=True)
     
-    # Find all files with the specified extension
-    if recursive:
-        # Use ** to search recursively in all subdirectories
-        files = list(source_dir.glob(f'**/*{file_ext}'))
-        # Exclude files already in irrelevant folder
-        files = [f for f in files if 'irrelevant' not in f.parts]
-    else:
-        # Only search in root directory
-        files = list(source_dir.glob(f'*{file_ext}'))
+    # Find all files with the specified extension (excluding the irrelevant folder)
+    files = list(iter_files(source_dir, file_ext, recursive))
+    
+    # Names already in the irrelevant folder, scanned once so conflict checks
+    # don't need a stat() per file; normcase'd so they stay case-insensitive on
+    # Windows, like the exists() check they replace
+    with os.scandir(irrelevant_dir) as entries:
+        existing_names = {os.path.normcase(entry.name) for entry in entries}
+    
+    # Entry paths all start with source_dir + separator, so relative paths for
+    # display are a string slice rather than Path.relative_to
+    prefix_len = len(os.path.join(str(source_dir), ''))
     
     moved_count = 0
     kept_count = 0
+    messages = []  # Progress lines, written in batches instead of one print per file
     
-    for filepath in files:
-        project_id = extract_project_id(filepath)
+    for entry in files:
+        if len(messages) >= PROGRESS_BATCH_SIZE:
+            write_messages(messages)
+        
+        filepath = Path(entry.path)
+        project_id = extract_project_id(entry.name)
         
         if project_id is None:
-            print(f"  ⚠ Could not extract project ID from: {filepath.relative_to(source_dir)}")
+            messages.append(f"  ⚠ Could not extract project ID from: {entry.path[prefix_len:]}")
             # Move files without extractable project IDs to irrelevant
             try:
                 dest = irrelevant_dir / filepath.name
                 # Handle name conflicts
-                if dest.exists():
+                if os.path.normcase(dest.name) in existing_names:
                     dest = irrelevant_dir / f"{filepath.stem}_{filepath.parent.name}{filepath.suffix}"
-                shutil.move(str(filepath), str(dest))
+                move_file(filepath, dest)
+                existing_names.add(os.path.normcase(dest.name))
                 moved_count += 1
             except Exception as e:
-                print(f"    ✗ Error moving file: {e}")
+                messages.append(f"    ✗ Error moving file: {e}")
             continue
         
         if project_id not in relevant_ids:
@@ -149,25 +229,26 @@ def organize_files(source_dir: Path, irrelevant_dir: Path, relevant_ids: set, fi
             try:
                 dest = irrelevant_dir / filepath.name
                 # Handle name conflicts (e.g., if same filename exists in root and scanned)
-                if dest.exists():
+                if os.path.normcase(dest.name) in existing_names:
                     # Add subdirectory name to avoid conflicts
-                    rel_path = filepath.relative_to(source_dir)
-                    if len(rel_path.parts) > 1:
+                    subdir, sep, _ = entry.path[prefix_len:].partition(os.sep)
+                    if sep:
                         # File is in a subdirectory
-                        dest = irrelevant_dir / f"{filepath.stem}_{rel_path.parts[0]}{filepath.suffix}"
+                        dest = irrelevant_dir / f"{filepath.stem}_{subdir}{filepath.suffix}"
                     else:
                         dest = irrelevant_dir / f"{filepath.stem}_duplicate{filepath.suffix}"
                 
-                shutil.move(str(filepath), str(dest))
+                move_file(filepath, dest)
+                existing_names.add(os.path.normcase(dest.name))
                 moved_count += 1
                 if moved_count <= 10:  # Show first 10 moves
-                    rel_display = filepath.relative_to(source_dir)
-                    print(f"  → Moved: {rel_display} (project ID: {project_id})")
+                    messages.append(f"  → Moved: {entry.path[prefix_len:]} (project ID: {project_id})")
             except Exception as e:
-                print(f"    ✗ Error moving {filepath.name}: {e}")
+                messages.append(f"    ✗ Error moving {filepath.name}: {e}")
         else:
             kept_count += 1
     
+    write_messages(messages)
     return moved_count, kept_count
 
 
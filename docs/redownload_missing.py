@@ -1,21 +1,32 @@
 """Re-download missing project documents with valid URLs."""
 
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from download import (
     download_file,
     extract_filename_from_url,
     sanitize_filename,
     format_file_size,
-    project_file_exists
+    index_existing_project_files
 )
 from config import FOLDER_SOURCE, CLOUD_BASE_PATH
 import os
 
+# python-calamine is optional - when installed, pandas (2.2+) parses xlsx with it
+# instead of openpyxl, which is much faster on large workbooks
+try:
+    import python_calamine  # noqa: F401
+    PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split('.')[:2])
+    EXCEL_ENGINE = 'calamine' if PANDAS_VERSION >= (2, 2) else 'openpyxl'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
 # Constants
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_DOCS_EXCEL = SCRIPT_DIR / "project_documents.xlsx"
 DIAGNOSIS_FILE = SCRIPT_DIR / "missing_docs_diagnosis.txt"
+DOWNLOAD_WORKERS = 8  # Parallel downloads (network-bound, so threads are enough)
 
 # Output directory based on FOLDER_SOURCE
 if FOLDER_SOURCE == "cloud":
@@ -32,25 +43,24 @@ def get_missing_project_ids():
         print(f"Error: Diagnosis file not found: {DIAGNOSIS_FILE}")
         return missing_ids
     
+    # Stream the file line by line; reading stops at the end of the list
     with open(DIAGNOSIS_FILE, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
         in_valid_section = False
         skip_next_separator = False
-        for line in lines:
+        for line in f:
+            line = line.strip()
             if "Valid Url:" in line:
                 in_valid_section = True
                 skip_next_separator = True  # Skip the separator line right after "Valid Url:"
                 continue
-            if skip_next_separator and line.strip().startswith("-"):
+            if skip_next_separator and line.startswith("-"):
                 skip_next_separator = False
                 continue  # Skip the first separator line
-            if in_valid_section and line.strip().startswith("-"):
+            if in_valid_section and line.startswith("-"):
                 break  # Stop at the second separator line (end of list)
-            if in_valid_section and line.strip():
-                # Extract project ID (may have leading spaces)
-                pid = line.strip()
-                if pid.isdigit():
-                    missing_ids.append(pid)
+            # Extract project ID (leading spaces already stripped)
+            if in_valid_section and line.isdigit():
+                missing_ids.append(line)
     
     return missing_ids
 
@@ -76,7 +86,7 @@ def redownload_missing_projects():
     
     print(f"\nReading {PROJECT_DOCS_EXCEL}...")
     try:
-        df = pd.read_excel(PROJECT_DOCS_EXCEL)
+        df = pd.read_excel(PROJECT_DOCS_EXCEL, engine=EXCEL_ENGINE)
         df['project_id'] = df['project_id'].astype(str)
         print(f"  ✓ Loaded {len(df)} document records")
     except Exception as e:
@@ -90,13 +100,23 @@ def redownload_missing_projects():
         print(f"  ✗ Error: Missing required columns: {', '.join(missing_columns)}")
         return
     
+    # Index documents by project ID once, as plain dicts, so each lookup below is
+    # a hash lookup and the loop doesn't touch pandas at all
+    doc_counts = df['project_id'].value_counts().to_dict()
+    first_docs = (
+        df.drop_duplicates('project_id', keep='first')
+        .set_index('project_id')[['document_name', 'url']]
+        .to_dict('index')
+    )
+    del df
+    
     # Create output directory
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     print(f"\nOutput directory: {OUTPUT_DIR.absolute()}")
     
-    # Process each missing project
+    # Prepare downloads (sequential, so existence checks never race with workers)
     print(f"\n{'=' * 70}")
-    print("Downloading missing project documents...")
+    print("Preparing missing project documents...")
     print(f"{'=' * 70}")
     
     downloaded_count = 0
@@ -104,24 +124,26 @@ def redownload_missing_projects():
     error_count = 0
     not_found_count = 0
     error_project_ids = []  # Track project IDs with errors
+    downloads = []  # (project_id, url, filename, filepath)
+    queued_ids = set()
+    existing_files = index_existing_project_files(OUTPUT_DIR)
     
     for i, project_id in enumerate(missing_ids, 1):
         print(f"\n[{i}/{len(missing_ids)}] Project {project_id}:")
         
         # Find project in Excel
-        project_rows = df[df['project_id'] == project_id]
-        
-        if len(project_rows) == 0:
+        if project_id not in first_docs:
             print(f"  ✗ Not found in project_documents.xlsx")
             not_found_count += 1
             error_project_ids.append(project_id)
             continue
         
         # Get the first document (or best one if multiple)
-        if len(project_rows) > 1:
-            print(f"  ⚠ Multiple documents found ({len(project_rows)}), using first one")
+        doc_count = doc_counts[project_id]
+        if doc_count > 1:
+            print(f"  ⚠ Multiple documents found ({doc_count}), using first one")
         
-        doc = project_rows.iloc[0]
+        doc = first_docs[project_id]
         doc_name = str(doc['document_name'])
         url = str(doc['url'])
         
@@ -132,8 +154,12 @@ def redownload_missing_projects():
             error_project_ids.append(project_id)
             continue
         
-        # Check if file already exists
-        existing_file = project_file_exists(project_id, OUTPUT_DIR)
+        # Check if file already exists (or is already queued for download)
+        if project_id in queued_ids:
+            print(f"  ⊙ Already queued for download")
+            skipped_count += 1
+            continue
+        existing_file = existing_files.get(project_id)
         if existing_file:
             print(f"  ⊙ Already exists: {existing_file.name}")
             skipped_count += 1
@@ -151,18 +177,32 @@ def redownload_missing_projects():
         filename = f"{project_id}_{sanitize_filename(doc_name_base)}.pdf"
         filepath = OUTPUT_DIR / filename
         
-        # Download
         print(f"  Document: '{doc_name}'")
         print(f"  URL: {url[:80]}...")
-        success = download_file(url, filepath)
+        downloads.append((project_id, url, filename, filepath))
+        queued_ids.add(project_id)
+    
+    # Download in parallel
+    if downloads:
+        print(f"\n{'=' * 70}")
+        print(f"Downloading {len(downloads)} document(s) with {DOWNLOAD_WORKERS} workers...")
+        print(f"{'=' * 70}")
         
-        if success:
-            file_size = filepath.stat().st_size
-            print(f"  ✓ Downloaded: {filename} ({format_file_size(file_size)})")
-            downloaded_count += 1
-        else:
-            error_count += 1
-            error_project_ids.append(project_id)
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            futures = {
+                executor.submit(download_file, url, filepath, show_progress=False): (project_id, filename, filepath)
+                for project_id, url, filename, filepath in downloads
+            }
+            for future in as_completed(futures):
+                project_id, filename, filepath = futures[future]
+                if future.result():
+                    file_size = filepath.stat().st_size
+                    print(f"  ✓ Downloaded: {filename} ({format_file_size(file_size)})")
+                    downloaded_count += 1
+                else:
+                    print(f"  ✗ Failed: project {project_id}")
+                    error_count += 1
+                    error_project_ids.append(project_id)
     
     # Summary
     print(f"\n{'=' * 70}")
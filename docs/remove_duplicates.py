@@ -8,10 +8,11 @@ Configuration:
     - "cloud": uses {CLOUD_BASE_PATH}/project docs
 """
 
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-import re
 from config import FOLDER_SOURCE, CLOUD_BASE_PATH
 
 # Get script directory for local paths
@@ -25,6 +26,9 @@ else:  # local
 
 SCANNED_FOLDER = PROJECT_DOCS_FOLDER / "scanned"
 
+# Parallel deletions (each delete can be a sync round-trip on cloud folders)
+DELETE_WORKERS = 16
+
 
 def extract_project_id(filename: str) -> Optional[str]:
     """
@@ -37,14 +41,27 @@ def extract_project_id(filename: str) -> Optional[str]:
     Returns:
         Project ID if found, None otherwise
     """
-    # Try to extract project ID from the beginning of filename
-    # Pattern: digits at the start, followed by underscore
-    match = re.match(r'^(\d+)_', filename)
-    if match:
-        return match.group(1)
+    # Project ID is everything before the first underscore, if it is all digits
+    # (same as matching r'^(\d+)_', without the regex engine)
+    head, sep, _ = filename.partition('_')
+    if sep and head.isdecimal():
+        return head
     return None
 
 
+def iter_pdf_files(folder: Path):
+    """
+    Yield os.DirEntry objects for the PDF files directly inside folder.
+    
+    Uses os.scandir so the file check comes from the cached directory entry
+    rather than a stat() per file.
+    """
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if os.path.normcase(entry.name).endswith('.pdf') and entry.is_file():
+                yield entry
+
+
 def find_duplicates(main_folder: Path, scanned_folder: Path) -> List[Tuple[Path, Path]]:
     """
     Find duplicate files between main folder and scanned folder.
@@ -70,28 +87,32 @@ def find_duplicates(main_folder: Path, scanned_folder: Path) -> List[Tuple[Path,
     
     # Get all PDF files in scanned folder and index by project ID
     scanned_files: Dict[str, Path] = {}
-    for file in scanned_folder.glob("*.pdf"):
-        project_id = extract_project_id(file.name)
+    for entry in iter_pdf_files(scanned_folder):
+        project_id = extract_project_id(entry.name)
         if project_id:
             # If multiple files with same project ID, keep the first one found
             if project_id not in scanned_files:
-                scanned_files[project_id] = file
+                scanned_files[project_id] = Path(entry.path)
     
     print(f"Found {len(scanned_files)} unique project IDs in scanned folder")
     
-    # Check main folder for files with matching project IDs
-    main_files: Dict[str, Path] = {}
-    for file in main_folder.glob("*.pdf"):
-        project_id = extract_project_id(file.name)
+    # Check main folder for files with matching project IDs; only matches
+    # are turned into Path objects
+    main_ids = set()
+    main_matches: Dict[str, Path] = {}
+    for entry in iter_pdf_files(main_folder):
+        project_id = extract_project_id(entry.name)
         if project_id:
-            main_files[project_id] = file
+            main_ids.add(project_id)
+            if project_id in scanned_files:
+                main_matches[project_id] = Path(entry.path)
     
-    print(f"Found {len(main_files)} unique project IDs in main folder")
+    print(f"Found {len(main_ids)} unique project IDs in main folder")
     
     # Find duplicates (same project ID in both folders)
     for project_id, scanned_file in scanned_files.items():
-        if project_id in main_files:
-            duplicates.append((main_files[project_id], scanned_file))
+        if project_id in main_matches:
+            duplicates.append((main_matches[project_id], scanned_file))
     
     return duplicates
 
@@ -135,19 +156,26 @@ def remove_duplicates(dry_run: bool = False) -> None:
         print(f"  Main:   {main_file.name}")
         print(f"  Scanned: {scanned_file.name}")
         
-        if not dry_run:
-            try:
-                main_file.unlink()
-                print(f"  ✓ Deleted: {main_file.name}")
-                deleted_count += 1
-            except Exception as e:
-                print(f"  ✗ Error deleting {main_file.name}: {e}")
-                error_count += 1
-        else:
+        if dry_run:
             print(f"  [Would delete: {main_file.name}]")
             deleted_count += 1
         print()
     
+    if not dry_run:
+        print("Deleting duplicates...")
+        with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+            futures = {executor.submit(os.unlink, main_file): main_file for main_file, _ in duplicates}
+            for future in as_completed(futures):
+                main_file = futures[future]
+                try:
+                    future.result()
+                    print(f"  ✓ Deleted: {main_file.name}")
+                    deleted_count += 1
+                except Exception as e:
+                    print(f"  ✗ Error deleting {main_file.name}: {e}")
+                    error_count += 1
+        print()
+    
     # Summary
     print("=" * 60)
     print("Summary")
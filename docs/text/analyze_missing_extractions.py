@@ -1,7 +1,8 @@
 """Analyze which documents have missing extractions and why."""
 
-import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from collections import defaultdict
 
@@ -9,6 +10,136 @@ from collections import defaultdict
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import FOLDER_SOURCE, CLOUD_BASE_PATH
 
+# ijson is optional - streams project_info.json record by record so the whole
+# list never has to be held in memory
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# orjson is optional - parses project_info.json several times faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+# Markers that suggest a section exists in a text file (lowercase ASCII bytes;
+# file contents are matched as raw bytes, lowercased once, without decoding).
+# Brief markers are only looked for near the top of the file; challenge markers
+# anywhere.
+BRIEF_MARKERS = (
+    b'brief description', b'this project aims', b'project objective',
+    b'executive summary', b'project summary', b'project description'
+)
+CHALLENGE_MARKERS = (
+    b'challenges to be addressed', b'problem statement', b'situation analysis',
+    b'challenges facing', b'problems include', b'barriers'
+)
+BRIEF_MARKER_WINDOW = 2000  # Bytes from the start searched for brief markers
+HEAD_READ_SIZE = 64 * 1024  # First read; covers most extracted text files whole
+READ_CHUNK_SIZE = 1 << 20  # Bytes read at a time when scanning past the head
+WRITE_BUFFER_SIZE = 1 << 20  # Output files are written with few large syscalls
+SCAN_WORKERS = 16  # Sample files scanned in parallel (I/O-bound, esp. on cloud folders)
+# A challenge marker can straddle a chunk boundary by at most this many characters
+CHALLENGE_MARKER_OVERLAP = max(len(marker) for marker in CHALLENGE_MARKERS) - 1
+# Flattens line breaks in the preview in a single pass
+PREVIEW_WHITESPACE_TABLE = str.maketrans({'\n': ' ', '\r': ' '})
+
+
+def sort_project_ids(project_ids):
+    """Sort project IDs numerically (non-numeric IDs sort first, as 0)."""
+    return sorted(project_ids, key=lambda x: int(x) if x.isdigit() else 0)
+
+
+def scan_text_file(txt_file):
+    """
+    Check a text file for brief and challenge markers.
+    
+    A single bounded read of the head covers the brief markers, the preview
+    and (for typical files) the challenge markers; the rest of the file is
+    read (in chunks, stopping at the first hit) only if no challenge marker
+    shows up in the head.
+    
+    Returns:
+        Tuple of (has_brief_marker, has_challenge_marker, preview)
+    """
+    with open(txt_file, 'rb') as f:
+        head = f.read(HEAD_READ_SIZE)
+        head_lower = head.lower()
+        brief_window = head_lower[:BRIEF_MARKER_WINDOW]
+        has_brief_marker = any(marker in brief_window for marker in BRIEF_MARKERS)
+        has_challenge_marker = any(marker in head_lower for marker in CHALLENGE_MARKERS)
+        # Each chunk is searched together with the tail of the previous one,
+        # so markers straddling a boundary are still found
+        tail = head_lower[-CHALLENGE_MARKER_OVERLAP:]
+        while not has_challenge_marker:
+            chunk = f.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            window = tail + chunk.lower()
+            has_challenge_marker = any(marker in window for marker in CHALLENGE_MARKERS)
+            tail = window[-CHALLENGE_MARKER_OVERLAP:]
+    
+    # Only the preview is decoded (CRLF folded as text mode would)
+    preview = head[:BRIEF_MARKER_WINDOW].decode('utf-8', errors='ignore').replace('\r\n', '\n')[:200]
+    return has_brief_marker, has_challenge_marker, preview
+
+
+def iter_project_records(path):
+    """
+    Yield the records of project_info.json one at a time.
+    
+    Streams the file with ijson when it is installed; otherwise the whole
+    list is parsed up front (with orjson if available, else json).
+    """
+    if IJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+    elif ORJSON_AVAILABLE:
+        yield from orjson.loads(path.read_bytes())
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            yield from json.load(f)
+
+
+def classify_project_records(path):
+    """
+    Classify project_info.json records by which extractions are missing.
+    
+    Records are classified as they are read, and nothing but the project IDs
+    outlives this call, so the parsed JSON is freed before the text files are
+    sampled.
+    
+    Returns:
+        Tuple of (total_documents, missing_brief, missing_challenges, missing_both)
+    """
+    missing_brief = []
+    missing_challenges = []
+    missing_both = []
+    total_documents = 0
+    
+    for item in iter_project_records(path):
+        total_documents += 1
+        # None and "" both count as missing
+        has_brief = bool(item.get('brief_description'))
+        has_challenges = bool(item.get('challenges_problem_statements'))
+        
+        if has_brief and has_challenges:
+            continue
+        project_id = item.get('project_id', 'unknown')
+        if not has_brief and not has_challenges:
+            missing_both.append(project_id)
+        elif not has_brief:
+            missing_brief.append(project_id)
+        else:
+            missing_challenges.append(project_id)
+    
+    return total_documents, missing_brief, missing_challenges, missing_both
+
+
 # Read the project_info.json
 script_dir = Path(__file__).parent
 project_info_file = script_dir.parent / "project_info.json"
@@ -17,37 +148,16 @@ if not project_info_file.exists():
     print(f"Error: {project_info_file} not found")
     exit(1)
 
-with open(project_info_file, 'r', encoding='utf-8') as f:
-    data = json.load(f)
-
 # Analyze missing extractions
-missing_brief = []
-missing_challenges = []
-missing_both = []
-all_nulls = []  # All project IDs with any null
-
-for item in data:
-    project_id = item.get('project_id', 'unknown')
-    brief = item.get('brief_description')
-    challenges = item.get('challenges_problem_statements')
-    
-    has_brief = brief is not None and brief != ""
-    has_challenges = challenges is not None and challenges != ""
-    
-    if not has_brief and not has_challenges:
-        missing_both.append(project_id)
-        all_nulls.append(project_id)
-    elif not has_brief:
-        missing_brief.append(project_id)
-        all_nulls.append(project_id)
-    elif not has_challenges:
-        missing_challenges.append(project_id)
-        all_nulls.append(project_id)
+total_documents, missing_brief, missing_challenges, missing_both = classify_project_records(project_info_file)
+
+# All project IDs with any null (the three lists are disjoint)
+all_nulls = missing_brief + missing_challenges + missing_both
 
 print("=" * 70)
 print("MISSING EXTRACTION ANALYSIS")
 print("=" * 70)
-print(f"\nTotal documents: {len(data)}")
+print(f"\nTotal documents: {total_documents}")
 print(f"Missing brief description only: {len(missing_brief)}")
 print(f"Missing challenges only: {len(missing_challenges)}")
 print(f"Missing both: {len(missing_both)}")
@@ -65,50 +175,63 @@ if FOLDER_SOURCE == "cloud":
 else:
     text_dir = script_dir
 
-# Sample a few files with missing extractions
-sample_ids = (missing_both[:5] + missing_brief[:3] + missing_challenges[:3])
-sample_ids = list(set(sample_ids))[:10]
+# Sample a few files with missing extractions (deduplicated, in a stable order)
+sample_ids = list(dict.fromkeys(missing_both[:5] + missing_brief[:3] + missing_challenges[:3]))[:10]
 
-print(f"\nAnalyzing {len(sample_ids)} sample files...")
+# List the text folder once (a single scandir pass, no per-entry Path objects or
+# pattern matching) and index files by the project ID before the first
+# underscore ({pid}_*.txt), instead of globbing the folder for every project
+txt_files_all = []
+if text_dir.is_dir():
+    with os.scandir(text_dir) as entries:
+        txt_files_all = [
+            entry for entry in entries
+            if os.path.normcase(entry.name).endswith('.txt') and entry.is_file()
+        ]
+txt_index = {}
+for txt_file in txt_files_all:
+    prefix, sep, _ = txt_file.name.partition('_')
+    if sep:
+        txt_index.setdefault(prefix, txt_file)
+
+# Find txt file for each project ({pid}_*.txt, falling back to {pid}*.txt)
+samples = []
 for pid in sample_ids:
-    # Find txt file for this project
-    txt_files = list(text_dir.glob(f"{pid}_*.txt"))
-    if not txt_files:
-        txt_files = list(text_dir.glob(f"{pid}*.txt"))
-    
-    if txt_files:
-        txt_file = txt_files[0]
+    txt_file = txt_index.get(pid)
+    if txt_file is None:
+        txt_file = next((f for f in txt_files_all if f.name.startswith(pid)), None)
+    if txt_file:
+        samples.append((pid, txt_file))
+
+# Scan the files in parallel, then report in sample order
+print(f"\nAnalyzing {len(sample_ids)} sample files...")
+with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+    futures = [executor.submit(scan_text_file, txt_file) for _, txt_file in samples]
+    for (pid, txt_file), future in zip(samples, futures):
         print(f"\n--- Project {pid}: {txt_file.name} ---")
         try:
-            with open(txt_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # Check for common patterns
-            has_brief_marker = any(marker in content[:2000] for marker in [
-                'Brief description', 'Brief Description', 'BRIEF DESCRIPTION',
-                'This project aims', 'Project Objective', 'Executive Summary',
-                'Project Summary', 'Project Description'
-            ])
-            
-            has_challenge_marker = any(marker in content for marker in [
-                'Challenges to be addressed', 'CHALLENGES TO BE ADDRESSED',
-                'Problem Statement', 'Situation Analysis', 'SITUATION ANALYSIS',
-                'challenges facing', 'problems include', 'barriers'
-            ])
-            
+            has_brief_marker, has_challenge_marker, preview = future.result()
             print(f"  Has brief marker: {has_brief_marker}")
             print(f"  Has challenge marker: {has_challenge_marker}")
-            print(f"  First 200 chars: {content[:200].replace(chr(10), ' ').replace(chr(13), ' ')}")
+            print(f"  First 200 chars: {preview.translate(PREVIEW_WHITESPACE_TABLE)}")
             
         except Exception as e:
             print(f"  Error reading file: {e}")
 
+# Sort each list once; the sorted lists are reused for both output files
+sorted_brief = sort_project_ids(missing_brief)
+sorted_challenges = sort_project_ids(missing_challenges)
+sorted_both = sort_project_ids(missing_both)
+sorted_all_nulls = sort_project_ids(all_nulls)
+# The complete list appears in both output files; build it once
+all_nulls_text = "".join(f"{pid}\n" for pid in sorted_all_nulls)
+
 # Save detailed analysis to file (same format as analyze_nulls.py)
 detailed_analysis_file = script_dir.parent / "null_values_analysis.txt"
-with open(detailed_analysis_file, 'w', encoding='utf-8') as f:
+with open(detailed_analysis_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
     f.write("NULL VALUES ANALYSIS\n")
     f.write("=" * 70 + "\n\n")
-    f.write(f"Total documents: {len(data)}\n\n")
+    f.write(f"Total documents: {total_documents}\n\n")
     f.write("SUMMARY\n")
     f.write("-" * 70 + "\n")
     f.write(f"Missing brief_description only: {len(missing_brief)}\n")
@@ -120,29 +243,25 @@ with open(detailed_analysis_file, 'w', encoding='utf-8') as f:
     if missing_brief:
         f.write(f"\n1. Missing brief_description only ({len(missing_brief)} projects):\n")
         f.write("-" * 70 + "\n")
-        for pid in sorted(missing_brief, key=lambda x: int(x) if x.isdigit() else 0):
-            f.write(f"{pid}\n")
+        f.write("".join(f"{pid}\n" for pid in sorted_brief))
     
     if missing_challenges:
         f.write(f"\n2. Missing challenges_problem_statements only ({len(missing_challenges)} projects):\n")
         f.write("-" * 70 + "\n")
-        for pid in sorted(missing_challenges, key=lambda x: int(x) if x.isdigit() else 0):
-            f.write(f"{pid}\n")
+        f.write("".join(f"{pid}\n" for pid in sorted_challenges))
     
     if missing_both:
         f.write(f"\n3. Missing both ({len(missing_both)} projects):\n")
         f.write("-" * 70 + "\n")
-        for pid in sorted(missing_both, key=lambda x: int(x) if x.isdigit() else 0):
-            f.write(f"{pid}\n")
+        f.write("".join(f"{pid}\n" for pid in sorted_both))
     
     f.write(f"\n\n4. ALL PROJECT IDs WITH NULL VALUES (Total: {len(all_nulls)}):\n")
     f.write("-" * 70 + "\n")
-    for pid in sorted(all_nulls, key=lambda x: int(x) if x.isdigit() else 0):
-        f.write(f"{pid}\n")
+    f.write(all_nulls_text)
 
 # Also save simple list file (for compatibility with other scripts)
 simple_list_file = script_dir.parent / "all_null_project_ids.txt"
-with open(simple_list_file, 'w', encoding='utf-8') as f:
+with open(simple_list_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
     f.write("ALL PROJECT IDs WITH NULL VALUES\n")
     f.write("=" * 70 + "\n\n")
     f.write(f"Total: {len(all_nulls)}\n\n")
@@ -153,8 +272,7 @@ with open(simple_list_file, 'w', encoding='utf-8') as f:
     f.write("=" * 70 + "\n")
     f.write("COMPLETE LIST (sorted):\n")
     f.write("=" * 70 + "\n")
-    for pid in sorted(all_nulls, key=lambda x: int(x) if x.isdigit() else 0):
-        f.write(f"{pid}\n")
+    f.write(all_nulls_text)
 
 print(f"\n{'=' * 70}")
 print("OUTPUT FILES")
@@ -15,14 +15,51 @@ Configuration:
 
 import os
 import re
-import json
 import sys
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path to import config
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import FOLDER_SOURCE, CLOUD_BASE_PATH
 
+# orjson is optional - writes project_info.json several times faster than json,
+# byte for byte the same as json.dump(indent=2, ensure_ascii=False)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+# Regex patterns are compiled once at import time rather than re-parsed (or
+# looked up in re's cache) on every call; the same applies to the extraction
+# pattern groups defined below.
+
+# Project ID from filename: the leading digits ({project_id}_{rest} or bare
+# digits), else the first run of 5+ digits anywhere
+PROJECT_ID_PATTERN = re.compile(r'^\d+|\d{5,}')
+
+# clean_text
+PAGE_MARKER_PATTERN = re.compile(r'\|\s*P\s*a\s*g\s*e\s*\d+')
+PAGE_LINE_PATTERN = re.compile(r'\n\s*Page\s+\d+\s*\n', re.IGNORECASE)
+PAGE_NUMBER_LINE_PATTERN = re.compile(r'^\d{1,3}\s*$', re.MULTILINE)
+# The same lines after the first: a leading '\n' (put back by the
+# substitution) lets the regex engine jump between newlines instead of trying
+# a MULTILINE '^' at every character
+PAGE_NUMBER_NEXT_LINE_PATTERN = re.compile(r'\n\d{1,3}\s*$', re.MULTILINE)
+# Different brief-description patterns often capture the same span of a
+# document, so recently cleaned sections are kept keyed by their text
+CLEAN_TEXT_CACHE_SIZE = 64
+
+# clean_double_letter_encoding
+DOUBLE_LETTER_PATTERN = re.compile(r'([A-Za-z])\1')
+TRIPLE_LETTER_PATTERN = re.compile(r'([A-Za-z])\1\1')
+LETTER_PATTERN = re.compile(r'[A-Za-z]')
+TRIPLE_CHAR_PATTERN = re.compile(r'(.)\1\1')
+DOUBLE_CHAR_PATTERN = re.compile(r'(.)\1')
+
 
 def extract_project_id(filename):
     """
@@ -36,39 +73,42 @@ def extract_project_id(filename):
     else:
         basename = os.path.basename(filename)
     
-    # Try to extract project ID from the beginning of filename (format: {project_id}_{rest})
-    match = re.match(r'^(\d+)_', basename)
+    # Project ID at the beginning of filename (format: {project_id}_{rest}, or
+    # digits without underscore); last resort: any long numeric sequence.
+    # {project_id}_ and the bare leading digits always capture the same digits,
+    # so one search covers all three cases.
+    match = PROJECT_ID_PATTERN.search(basename)
     if match:
-        return match.group(1)
-    
-    # Fallback: try to extract numeric ID at the beginning (without underscore)
-    match = re.match(r'^(\d+)', basename)
-    if match:
-        return match.group(1)
-    
-    # Last resort: try to find any numeric sequence in the filename
-    match = re.search(r'(\d{5,})', basename)
-    if match:
-        return match.group(1)
+        return match.group()
     
     # Final fallback: use filename without extension
     return Path(basename).stem
 
 
+@lru_cache(maxsize=CLEAN_TEXT_CACHE_SIZE)
 def clean_text(text):
     """Clean extracted text by removing extra whitespace and page markers"""
     if not text:
         return None
-    # Normalize line endings
-    text = text.replace('\r\n', '\n').replace('\r', '\n')
-    # Remove page markers in various formats
-    text = re.sub(r'\|\s*P\s*a\s*g\s*e\s*\d+', '', text)
-    text = re.sub(r'\n\s*Page\s+\d+\s*\n', '\n', text, flags=re.IGNORECASE)
-    text = re.sub(r'^\d{1,3}\s*$', '', text, flags=re.MULTILINE)
+    # Normalize line endings (sections cut from process_document() output are
+    # already normalized, so this is usually skipped)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    # Remove page markers in various formats ("| P a g e N" needs a literal '|')
+    if '|' in text:
+        text = PAGE_MARKER_PATTERN.sub('', text)
+    text = PAGE_LINE_PATTERN.sub('\n', text)
+    # Remove bare page-number lines (the first line, then the rest)
+    page_number = PAGE_NUMBER_LINE_PATTERN.match(text)
+    if page_number:
+        text = text[page_number.end():]
+    text = PAGE_NUMBER_NEXT_LINE_PATTERN.sub('\n', text)
     # Remove form feed and other control characters
-    text = re.sub(r'[\x0c]', '', text)
-    # Remove multiple consecutive newlines
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = text.replace('\x0c', '')
+    # Remove multiple consecutive newlines (each replace shortens every run of
+    # 3+ to about two thirds, so this ends with all runs at exactly 2)
+    while '\n\n\n' in text:
+        text = text.replace('\n\n\n', '\n\n')
     # Remove leading/trailing whitespace
     text = text.strip()
     return text if text else None
@@ -83,106 +123,409 @@ def clean_double_letter_encoding(text):
     if not text:
         return text
     
+    # Too few letters to judge: skip counting the repeats
+    total_letters = len(LETTER_PATTERN.findall(text))
+    if total_letters <= 20:
+        return text
+    
     # Pattern to detect double/triple-letter sequences
     # Check if text has significant repeated-letter encoding
-    double_letter_count = len(re.findall(r'([A-Za-z])\1', text))
-    triple_letter_count = len(re.findall(r'([A-Za-z])\1\1', text))
-    total_letters = len(re.findall(r'[A-Za-z]', text))
+    double_letter_count = len(DOUBLE_LETTER_PATTERN.findall(text))
+    triple_letter_count = len(TRIPLE_LETTER_PATTERN.findall(text))
     
     # If more than 20% of letter pairs are doubles/triples, likely encoded
-    if total_letters > 20 and (double_letter_count + triple_letter_count * 2) / (total_letters / 2) > 0.2:
+    if (double_letter_count + triple_letter_count * 2) / (total_letters / 2) > 0.2:
         # First handle triple characters (e.g., "mmm" -> "m", "(((" -> "(")
-        result = re.sub(r'(.)\1\1', r'\1', text)
+        result = TRIPLE_CHAR_PATTERN.sub(r'\1', text)
         # Then handle double characters (e.g., "TT" -> "T", "22" -> "2")
-        result = re.sub(r'(.)\1', r'\1', result)
+        result = DOUBLE_CHAR_PATTERN.sub(r'\1', result)
         return result
     
     return text
 
 
-def extract_brief_description(content):
+# =============================================================================
+# BRIEF DESCRIPTION PATTERNS (compiled once, used by extract_brief_description)
+# =============================================================================
+# Written in lowercase: they are matched against the lowercased document (see
+# lower_for_matching below), which stands in for re.IGNORECASE.
+
+# Group 1: Standard UNIDO "Brief description" format
+# End markers that indicate the end of brief description
+BRIEF_END_MARKERS = [
+    r'\n\s*approved[:\s]',
+    r'\n\s*table\s+of\s+contents',
+    r'\n\s*index\s*\n',
+    r'\n\s*executive\s+summary',
+    r'\n\s*on\s+behalf\s+of',
+    r'\n\s*signature[:\s]',
+    r'\n\s*part\s+[iv1-9]',
+    r'\n\s*a\.\s+context',
+    r'\n\s*a\.1\s+',
+    r'\n\s*b\.\s+',
+    r'\n\s*1\.\s+[a-z]',  # Numbered section start
+    r'\n\s*abbreviations',
+    r'\n\s*list\s+of\s+abbreviations',
+    r'\n\s*acronyms',
+    r'\n\s*contents\s*\n',
+]
+BRIEF_END_PATTERN = '|'.join(BRIEF_END_MARKERS)
+
+BRIEF_PATTERNS = [
+    # Standard format with colon
+    re.compile(rf'brief\s+description\s*[:\-]?\s*\n([\s\S]*?)(?={BRIEF_END_PATTERN})'),
+    # Without explicit markers, look for paragraph after "Brief description"
+    re.compile(r'brief\s+description\s*[:\-]?\s*\n([\s\S]+?)(?=\n\n\s*[a-z][a-z]+[:\s]|\n\n\s*\d+\.\s)'),
+]
+# Fallback: everything after "Brief description", cut at the earliest natural break.
+# Only the header is matched; the section starts at match.end() and is sliced out
+# once the break is known, instead of capturing (copying) the rest of the document.
+BRIEF_FALLBACK_PATTERN = re.compile(r'brief\s+description\s*[:\-]?\s*\n(?=[\s\S])')
+BRIEF_BREAK_MARKERS = [
+    r'\n\s*approved',
+    r'\n\s*table\s+of',
+    r'\n\s*index\s*\n',
+    r'\n\s*a\.\s',
+    r'\n\s*part\s+i',
+    r'\n\s*_{5,}',  # Underline separators
+    r'\n\s*-{5,}',  # Dash separators
+]
+# One alternation finds the earliest break of any kind in a single scan
+BRIEF_BREAK_PATTERN = re.compile('|'.join(BRIEF_BREAK_MARKERS))
+
+# Group 2: GEF CEO Endorsement "Project Objective" format
+GEF_OBJECTIVE_PATTERNS = [
+    # "Project Objective:" followed by description
+    re.compile(r'project\s+objective\s*[:\-]\s*([\s\S]*?)(?=\n\s*(?:trust|grant|project\s+component|expected|type|\(select\)|[a-z]\.\s+))'),
+    # Alternative: Project Objective in a table cell
+    re.compile(r'project\s+objective\s*[:\-]\s*([^\n]+(?:\n(?![a-z\d]\.)[^\n]+)*)'),
+]
+
+# Group 3: Executive Summary as fallback
+EXEC_SUMMARY_PATTERNS = [
+    re.compile(r'executive\s+summary\s*\n([\s\S]*?)(?=\n\s*(?:part\s+|[a-z]\.\s+|\d+\.\s+[a-z]|table\s+of\s+contents))'),
+    re.compile(r'executive\s+summary\s*[:\n]([\s\S]*?)(?=\n\s*(?:\d+\.\s+|[a-z]\.\s+|introduction|background))'),
+]
+
+# Group 4: Project Summary / Project Description
+PROJECT_SUMMARY_PATTERNS = [
+    re.compile(r'project\s+summary\s*[:\-]?\s*\n([\s\S]*?)(?=\n\s*(?:[a-z]\.\s+|\d+\.\s+[a-z]|part\s+))'),
+    re.compile(r'project\s+description\s*[:\-]?\s*\n([\s\S]*?)(?=\n\s*(?:[a-z]\.\s+|\d+\.\s+[a-z]|part\s+))'),
+]
+
+# Group 5: UNDP Project Document format - "This project aims..."
+UNDP_PATTERNS = [
+    # "This project aims/seeks/is designed to..." - capture the paragraph
+    re.compile(r'((?:this|the)\s+project\s+(?:aims|seeks|is\s+designed|is\s+expected|will)\s+to[^.]+\.(?:[^.]+\.){0,5})'),
+    # After "Implementing Agency:" look for project description paragraph
+    re.compile(r'implementing\s+(?:agency|partner)\s*:\s*[^\n]+\n\s*([a-z][^.]+(?:project|programme|initiative)[^.]*\.(?:[^.]+\.){0,5})'),
+]
+
+# Group 6: GEF PPG "Describe the PPG activities" format
+PPG_PATTERNS = [
+    # PPG activities and justifications
+    re.compile(r'describe\s+the\s+ppg\s+activities\s+and\s+justifications\s*[:\-]?\s*([\s\S]*?)(?=\n\s*(?:list\s+of\s+proposed|the\s+following\s+provides|component\s+\d|[a-z]\.\s+[a-z]))'),
+    # Project title description in PPG
+    re.compile(r'project\s+title\s*[:\-]\s*([^\n]+)'),
+]
+
+# Group 7: Situation Analysis intro (fallback for UNDP docs)
+SITUATION_INTRO_PATTERN = re.compile(r'(?:i\.|1\.)\s*situation\s+analysis\s*\n([\s\S]*?)(?=\n\s*(?:ii\.|2\.|economy|energy|agriculture|[a-z][a-z]+\s*:))')
+
+# Group 8: Abstract section (for project reports/brochures)
+ABSTRACT_PATTERNS = [
+    re.compile(r'\n\s*abstract\s*\n([\s\S]*?)(?=\n\s*(?:content|table\s+of\s+contents|introduction|\d+\s+[a-z]|[a-z]+\s+[a-z]+:))'),
+    re.compile(r'\n\s*abstract\s*\n([\s\S]*?)(?=\n\s*(?:content|table\s+of|introduction|\d+\s+[a-z]))'),
+]
+
+# Group 9: Program Vision and Mission / Program Objectives
+PROGRAM_PATTERNS = [
+    # Program Vision and Mission section
+    re.compile(r'program\s+vision\s+and\s+mission\s*\n([\s\S]*?)(?=\n\s*(?:program\s+objectives|the\s+\dadi|[a-z][a-z]+\s+objectives|\d+\s*\n))'),
+    # Program Objectives section
+    re.compile(r'program\s+objectives(?:\s+and\s+expected\s+impact)?\s*\n([\s\S]*?)(?=\n\s*(?:for\s+the\s+|support\s+to|i\.\s+problem|table\s+\d))'),
+]
+
+# Group 10: Country Programme Framework intro paragraph
+# Alternative: The [Country] Country Programme Framework... paragraph
+CPF_SENTENCES_PATTERN = re.compile(r'(the\s+[a-z][a-z]+\s+country\s+programme\s+framework[^.]+\.(?:[^.]+\.){1,10})')
+CPF_PATTERNS = [
+    # Country Programme Framework intro - typically right after title, before signatures
+    re.compile(r'country\s+programme\s+(?:framework|for)\s+[^\n]+\n(?:for\s+[^\n]+\n)?(?:inclusive[^\n]+\n)?(?:\d{4}[^\n]*\n)?([\s\S]*?)(?=\n\s*_{5,}|\n\s*[a-z][a-z]+\s+[a-z][a-z]+\s*\n\s*director)'),
+    CPF_SENTENCES_PATTERN,
+]
+
+# Group 11: Value Chain / Support Program description
+VALUE_CHAIN_PATTERNS = [
+    # Value Chain Support Program intro
+    re.compile(r'(?:value\s+chain|support\s+program)[^\n]*\n(?:prospective[^\n]*\n)?([\s\S]*?)(?=\n\s*(?:contents|table\s+of\s+contents|acronyms|\d+\s*\n))'),
+    # Country Context as description
+    re.compile(r'country\s+context\s*\n([\s\S]*?)(?=\n\s*(?:the\s+\dadi|contents|acronyms|tables\s+and))'),
+]
+
+# Group 12: One Programme / UN Programme Objective
+ONE_PROGRAMME_PATTERNS = [
+    # "1 Objective of the One Programme" or similar numbered objective
+    re.compile(r'\d+\s+objective\s+of\s+the\s+(?:one\s+)?programme\s*\n([\s\S]*?)(?=\n\s*\d+\s+(?:one\s+)?programme\s+structure|\n\s*\d+\.\d+|\n\s*2\s+[a-z])'),
+    # "Objective of the Programme" without number
+    re.compile(r'objective\s+of\s+the\s+(?:one\s+)?programme\s*\n([\s\S]*?)(?=\n\s*(?:programme\s+structure|\d+\.\d+|\d+\s+[a-z]))'),
+    # Generic "Programme Objective" section
+    re.compile(r'programme\s+objective[s]?\s*\n([\s\S]*?)(?=\n\s*(?:\d+\s+[a-z]|\d+\.\d+|programme\s+structure))'),
+]
+
+# Group 13: Meeting Report / Committee Report Introduction
+MEETING_REPORT_PATTERNS = [
+    # "Introduction" section with numbered paragraphs (like ExCom reports)
+    re.compile(r'\n\s*introduction\s*\n((?:\d+\.\s+[\s\S]*?)(?=\n\s*agenda\s+item|\n\s*[a-z]+\s+item|\n\s*\d+\.\s+[a-z][a-z]+\s+of))'),
+    # "REPORT OF THE..." followed by Introduction
+    re.compile(r'report\s+of\s+the\s+[^\n]+\n\s*introduction\s*\n([\s\S]*?)(?=\n\s*agenda\s+item)'),
+    # Generic Introduction for reports
+    re.compile(r'\n\s*introduction\s*\n([\s\S]*?)(?=\n\s*(?:agenda|contents|table\s+of|i\.\s+|1\.\s+[a-z][a-z]+\s+[a-z]))'),
+]
+
+# Group 14: Short description field (PRODOC format)
+SHORT_DESC_PATTERNS = [
+    # "The overall objective" paragraph (common in PRODOC header tables)
+    re.compile(r'total\s+budget[^\n]*\n(the\s+overall\s+objective[\s\S]*?)(?=\n\s*(?:\d+\s*\n\s*project|\n\s*contents|[a-z]\.\s+[a-z]))'),
+    # "Short description" field in project header
+    re.compile(r'short\s+description\s*\n?([\s\S]*?)(?=\n\s*(?:contents|table\s+of|[a-z]\.\s+[a-z]|\d+\s*\n\s*project))'),
+    # Alternative: Short description followed by section
+    re.compile(r'short\s+description\s*[:\n]\s*([\s\S]*?)(?=\n\s*(?:[a-z]\.\s+[a-z]|contents|background))'),
+]
+# Table formatting artifact: a repeated "Short description" label mid-text
+SHORT_DESC_LABEL_PATTERN = re.compile(r'\n\s*Short\s+description\s*\n', re.IGNORECASE)
+
+# Group 15: Project Purpose / A1. Project Purpose (PRODOC format)
+PROJECT_PURPOSE_PATTERNS = [
+    # "A1. Project Purpose" or "A.1 Project Purpose"
+    re.compile(r'a\.?\s*1\.?\s*project\s+purpose\s*\n([\s\S]*?)(?=\n\s*(?:a\.?\s*2|figure\s+\d|the\s+project\s+will|the\s+main\s+rationale))'),
+    # "Project Purpose" standalone
+    re.compile(r'\n\s*project\s+purpose\s*\n([\s\S]*?)(?=\n\s*(?:[a-z]\.?\s*\d|figure|table|the\s+project))'),
+]
+
+# Group 16: PROJECT DESCRIPTION section (ExCom project proposals)
+PROJECT_DESC_PATTERNS = [
+    # "PROJECT DESCRIPTION" followed by "Background"
+    re.compile(r'project\s+description\s*\n\s*(?:background\s*\n)?([\s\S]*?)(?=\n\s*(?:secretariat|project\s+evaluation|[a-z]+\s+costs|\d+\.\s+on\s+behalf))'),
+    # Generic PROJECT DESCRIPTION
+    re.compile(r'project\s+description\s*\n([\s\S]*?)(?=\n\s*(?:[a-z]{2,}\s+[a-z]|table\s+\d|\d+\s*\n\s*[a-z]))'),
+]
+
+# Group 17: Work Programme / Work Plan intro (internal documents)
+WORK_PLAN_PATTERNS = [
+    # "A. Work Programme and Budget" section with intro paragraph
+    re.compile(r'a\.\s*work\s+programme\s+and\s+budget[^\n]*\n([\s\S]*?)(?=\n\s*(?:this\s+work\s+plan|b\.\s+planned|the\s+gs\s+inter))'),
+    # Work Programme intro paragraph after title - capture "Advancing gender equality..." type intros
+    re.compile(r'(?:2020\s*[-–]\s*2023|implementation[^\n]*)\s*\n\s*a\.\s*work\s+programme[^\n]*\n(advancing[\s\S]*?)(?=\n\s*(?:this\s+work\s+programme|the\s+gs))'),
+    # Generic work plan intro - paragraphs starting with organizational description
+    re.compile(r'work\s+programme\s+and\s+budget[^\n]*\n(?:\d{4}[^\n]*\n)?(?:for[^\n]*\n)?([\s\S]*?)(?=\n\s*(?:this\s+work\s+programme|b\.\s+|table\s+of|contents))'),
+]
+
+# Group 18: A. INTRODUCTION section (evaluation/audit work plans)
+INTRO_SECTION_PATTERNS = [
+    # "A. INTRODUCTION" with numbered paragraphs
+    re.compile(r'a\.\s*introduction\s*\n([\s\S]*?)(?=\n\s*b\.\s+[a-z])'),
+    # Generic lettered Introduction section
+    re.compile(r'[a-z]\.\s*introduction\s*\n([\s\S]*?)(?=\n\s*[a-z]\.\s+[a-z])'),
+]
+
+# Group 19: Objectives of the action (EU Grant format) - check BEFORE SUMMARY
+OBJECTIVES_PATTERNS = [
+    # "Objectives of the action" in grant forms - capture until Target group
+    re.compile(r'objectives?\s+of\s+the\s+action\s*\n([\s\S]*?)(?=\n\s*target\s+group)'),
+]
+
+# Group 20: SUMMARY section (standalone or numbered)
+SUMMARY_SECTION_PATTERNS = [
+    # Standalone "SUMMARY" section (NOT "SUMMARY OF THE ACTION" which is a table format)
+    re.compile(r'\n\s*summary\s*\n([\s\S]*?)(?=\n\s*(?:the\s+proposed|more\s+precisely|prior\s+to|\d+\.\s+[a-z]|[a-z]\.\s+[a-z]|table\s+of))'),
+    # Summary followed by project description
+    re.compile(r'\n\s*summary\s*[:\n]\s*([\s\S]*?)(?=\n\s*(?:\d+\.\s+|[a-z]\.\s+|table\s+of|contents))'),
+]
+
+# Group 20: "The application relates to:" pattern
+APPLICATION_PATTERNS = [
+    re.compile(r'the\s+application\s+relates\s+to\s*[:\n]\s*([\s\S]*?)(?=\n\s*(?:location|total\s+calculated|timeframe|previous))'),
+]
+
+# Group 21: Brief description field in header table (ONLY in first 6000 chars)
+BRIEF_FIELD_PATTERNS = [
+    # "Brief description:" field - capture multiline content until "Approved" or page number
+    re.compile(r'brief\s+description\s*:\s*([\s\S]*?)(?=\n\s*(?:\d+\s*\n\s*\n|approved\s*:|page\s+\d))'),
+]
+
+# Group 22: Preamble before Table of Contents (UNIDO project docs)
+PREAMBLE_PATTERNS = [
+    # Content between "In-kind" and "Approved:" - common UNIDO PRODOC format
+    re.compile(r'(?:in-kind|counterpart\s+inputs\s+in-kind)[^\n]*\n(since[\s\S]*?)(?=\n\s*approved\s*:)'),
+    # Content starting with "Since the signing" before Approved
+    re.compile(r'\n(since\s+the\s+signing[\s\S]*?)(?=\n\s*approved\s*:)'),
+    # Content between header info and Approved/Table of Contents
+    re.compile(r'(?:executing\s+agency|unido\s+inputs)[^\n]*\n([\s\S]*?)(?=\n\s*(?:table\s+of\s+contents|contents\s*\n|approved\s*:))'),
+]
+# Preambles that are just signature blocks are skipped
+PREAMBLE_SIGNATURE_PATTERN = re.compile(r'^[\s\n]*Signature|^[\s\n]*On\s+behalf')
+
+# Group 23: Service Summary Sheet / Origin of proposal
+SERVICE_SUMMARY_PATTERNS = [
+    # "Origin of proposal:" section
+    re.compile(r'origin\s+of\s+proposal\s*[:\n]\s*([\s\S]*?)(?=\n\s*(?:problem|research\s+issue|objective|expected))'),
+    # Service Summary Sheet intro after title
+    re.compile(r'service\s+summary\s+sheet\s*\n(?:[^\n]*\n){1,5}([\s\S]*?)(?=\n\s*(?:problem|sss-|page\s+\d))'),
+]
+
+
+# Matching: the patterns above are written in lowercase and run case-sensitively
+# on a lowercased copy of the document, which is much faster than having the
+# regex engine case-fold every comparison; captured sections are then cut from
+# the original text at the same offsets. This is exactly equivalent to
+# re.IGNORECASE on the original as long as each character folds to one
+# character the way re does: U+0130/U+0131 to 'i' and U+017F to 's' (lower()
+# gives two characters for U+0130 and leaves the other two alone).
+#
+# Anchors: before a pattern is run, a word every match of it must contain is
+# looked up in the lowercased document with a plain substring search (far
+# cheaper than a regex scan). For a group, the anchors are alternatives: each
+# pattern in the group requires at least one of them.
+CASE_FOLDS = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's'})
+
+
+def lower_for_matching(text):
+    """Lowercase text one character for one, folding the characters above."""
+    if not text.isascii() and any(ch in text for ch in '\u0130\u0131\u017f'):
+        text = text.translate(CASE_FOLDS)
+    return text.lower()
+
+
+def original_group(match, content, group=1):
+    """Return a group of a match made on the lowercased copy, from content."""
+    return content[match.start(group):match.end(group)]
+
+
+def applicable_patterns(patterns, content_lower, *anchors):
+    """Return the group's patterns, or none if no anchor occurs in the document."""
+    if any(anchor in content_lower for anchor in anchors):
+        return patterns
+    return ()
+
+
+# Sections: most patterns capture a lazy body up to a lookahead for whatever
+# ends the section, "header([\s\S]*?)(?=end)". When the end never occurs after
+# a header, re scans from every occurrence of the header to the end of the
+# document before giving up, which is quadratic in documents that repeat the
+# header (running heads, tables of contents). Searching for the header and the
+# end on their own first rules that case out with two linear scans. (An end
+# that allows \Z always holds, so those patterns need no guard.)
+SECTION_BODIES = (r'([\s\S]*?)', r'([\s\S]+?)')
+SECTION_GUARDS = {}
+
+
+def section_guard(pattern):
+    """Return the (header, end) patterns of a section pattern, or None (cached)."""
+    if pattern not in SECTION_GUARDS:
+        guard = None
+        for body in SECTION_BODIES:
+            header, found, end = pattern.pattern.partition(body)
+            if (found and end.startswith('(?=') and end.endswith(')')
+                    and body not in end and r'\Z' not in end):
+                try:
+                    guard = (re.compile(header, pattern.flags), re.compile(end, pattern.flags))
+                except re.error:
+                    pass
+                break
+        SECTION_GUARDS[pattern] = guard
+    return SECTION_GUARDS[pattern]
+
+
+def search_section(pattern, content_lower, start=0, endpos=None):
+    """
+    pattern.search(content_lower, start, endpos), skipping hopeless searches.
+    
+    No match can start before the header first occurs, and every match needs
+    the end lookahead to hold somewhere after its start; if it holds nowhere
+    after the first header, there is no match.
+    """
+    if endpos is None:
+        endpos = len(content_lower)
+    guard = section_guard(pattern)
+    if guard is None:
+        return pattern.search(content_lower, start, endpos)
+    header_pattern, end_pattern = guard
+    header = header_pattern.search(content_lower, start, endpos)
+    if header is None or end_pattern.search(content_lower, header.start(), endpos) is None:
+        return None
+    return pattern.search(content_lower, header.start(), endpos)
+
+
+def search_from_prefix(pattern, content_lower, prefix, endpos=None):
+    """
+    Search for a pattern whose match always starts with the word prefix.
+    
+    No match can start before the prefix first occurs, so the regex scan starts
+    there; finding the word with str.find is far cheaper than scanning up to it
+    with the regex.
+    """
+    if endpos is None:
+        endpos = len(content_lower)
+    start = content_lower.find(prefix, 0, endpos)
+    if start < 0:
+        return None
+    return search_section(pattern, content_lower, start, endpos)
+
+
+def search_sentences(pattern, text, endpos=None):
+    """
+    Search text[:endpos] with a pattern whose match always ends on a full stop.
+    
+    Nothing after the last '.' can be part of such a match, so the search stops
+    there. Without the bound, every prefix hit in a long period-free tail
+    (tables, lists, OCR noise) rescans the tail to the end, which is quadratic.
+    """
+    if endpos is None:
+        endpos = len(text)
+    return pattern.search(text, 0, text.rfind('.', 0, endpos) + 1)
+
+
+def extract_brief_description(content, content_lower=None):
     """Extract the 'Brief description' section from the document - NO LENGTH LIMITS"""
     
+    # Patterns run on the lowercased copy (lower_for_matching(content), made
+    # here unless the caller already has it); pattern groups whose header words
+    # do not occur are skipped
+    if content_lower is None:
+        content_lower = lower_for_matching(content)
+    
     # ==========================================================================
     # PATTERN GROUP 1: Standard UNIDO "Brief description" format
     # ==========================================================================
     
-    # List of end markers that indicate the end of brief description
-    end_markers = [
-        r'\n\s*Approved[:\s]',
-        r'\n\s*TABLE\s+OF\s+CONTENTS',
-        r'\n\s*INDEX\s*\n',
-        r'\n\s*EXECUTIVE\s+SUMMARY',
-        r'\n\s*On\s+behalf\s+of',
-        r'\n\s*Signature[:\s]',
-        r'\n\s*PART\s+[IV1-9]',
-        r'\n\s*A\.\s+CONTEXT',
-        r'\n\s*A\.1\s+',
-        r'\n\s*B\.\s+',
-        r'\n\s*1\.\s+[A-Z]',  # Numbered section start
-        r'\n\s*ABBREVIATIONS',
-        r'\n\s*LIST\s+OF\s+ABBREVIATIONS',
-        r'\n\s*ACRONYMS',
-        r'\n\s*Contents\s*\n',
-    ]
-    
-    # Build combined end pattern
-    end_pattern = '|'.join(end_markers)
-    
-    # Try to find "Brief description" section
-    brief_patterns = [
-        # Standard format with colon
-        rf'Brief\s+description\s*[:\-]?\s*\n([\s\S]*?)(?={end_pattern})',
-        # Without explicit markers, look for paragraph after "Brief description"
-        rf'Brief\s+description\s*[:\-]?\s*\n([\s\S]+?)(?=\n\n\s*[A-Z][a-z]+[:\s]|\n\n\s*\d+\.\s)',
-    ]
-    
-    for pattern in brief_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in BRIEF_PATTERNS:
+        match = search_from_prefix(pattern, content_lower, 'brief')
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 50:  # Minimum sanity check only
                 return cleaned
     
     # Fallback: get content after "Brief description" until a clear section break
-    match = re.search(r'Brief\s+description\s*[:\-]?\s*\n([\s\S]+)', content, re.IGNORECASE)
+    match = search_from_prefix(BRIEF_FALLBACK_PATTERN, content_lower, 'brief')
     if match:
-        text = match.group(1)
+        start = match.end()
         # Try to find a natural break point
-        break_patterns = [
-            r'\n\s*Approved',
-            r'\n\s*TABLE\s+OF',
-            r'\n\s*INDEX\s*\n',
-            r'\n\s*A\.\s',
-            r'\n\s*PART\s+I',
-            r'\n\s*_{5,}',  # Underline separators
-            r'\n\s*-{5,}',  # Dash separators
-        ]
-        earliest_break = len(text)
-        for bp in break_patterns:
-            m = re.search(bp, text, re.IGNORECASE)
-            if m and m.start() < earliest_break:
-                earliest_break = m.start()
+        m = BRIEF_BREAK_PATTERN.search(content_lower, start)
+        earliest_break = (m.start() if m else len(content)) - start
         
         if earliest_break > 50:
-            return clean_text(text[:earliest_break])
+            return clean_text(content[start:start + earliest_break])
     
     # ==========================================================================
     # PATTERN GROUP 2: GEF CEO Endorsement "Project Objective" format
     # ==========================================================================
     
-    gef_patterns = [
-        # "Project Objective:" followed by description
-        r'Project\s+Objective\s*[:\-]\s*([\s\S]*?)(?=\n\s*(?:Trust|Grant|Project\s+Component|Expected|Type|\(select\)|[A-Z]\.\s+))',
-        # Alternative: Project Objective in a table cell
-        r'Project\s+Objective\s*[:\-]\s*([^\n]+(?:\n(?![A-Z\d]\.)[^\n]+)*)',
-    ]
-    
-    for pattern in gef_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in applicable_patterns(GEF_OBJECTIVE_PATTERNS, content_lower, 'objective'):
+        match = search_section(pattern, content_lower)
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 20:
                 return cleaned
@@ -191,15 +534,10 @@ def extract_brief_description(content):
     # PATTERN GROUP 3: Executive Summary as fallback
     # ==========================================================================
     
-    exec_patterns = [
-        r'EXECUTIVE\s+SUMMARY\s*\n([\s\S]*?)(?=\n\s*(?:PART\s+|[A-Z]\.\s+|\d+\.\s+[A-Z]|TABLE\s+OF\s+CONTENTS))',
-        r'Executive\s+Summary\s*[:\n]([\s\S]*?)(?=\n\s*(?:\d+\.\s+|[A-Z]\.\s+|Introduction|Background))',
-    ]
-    
-    for pattern in exec_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in EXEC_SUMMARY_PATTERNS:
+        match = search_from_prefix(pattern, content_lower, 'executive')
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 100:
                 return cleaned
@@ -208,15 +546,10 @@ def extract_brief_description(content):
     # PATTERN GROUP 4: Project Summary / Project Description
     # ==========================================================================
     
-    summary_patterns = [
-        r'Project\s+Summary\s*[:\-]?\s*\n([\s\S]*?)(?=\n\s*(?:[A-Z]\.\s+|\d+\.\s+[A-Z]|PART\s+))',
-        r'Project\s+Description\s*[:\-]?\s*\n([\s\S]*?)(?=\n\s*(?:[A-Z]\.\s+|\d+\.\s+[A-Z]|PART\s+))',
-    ]
-    
-    for pattern in summary_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in PROJECT_SUMMARY_PATTERNS:
+        match = search_from_prefix(pattern, content_lower, 'project')
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 50:
                 return cleaned
@@ -226,19 +559,12 @@ def extract_brief_description(content):
     # ==========================================================================
     
     # Look for project summary paragraph starting with common phrases
-    # Must be near the beginning of the document (within first 5000 chars)
-    first_5000 = content[:5000]
-    undp_patterns = [
-        # "This project aims/seeks/is designed to..." - capture the paragraph
-        r'((?:This|The)\s+project\s+(?:aims|seeks|is\s+designed|is\s+expected|will)\s+to[^.]+\.(?:[^.]+\.){0,5})',
-        # After "Implementing Agency:" look for project description paragraph
-        r'Implementing\s+(?:Agency|Partner)\s*:\s*[^\n]+\n\s*([A-Z][^.]+(?:project|programme|initiative)[^.]*\.(?:[^.]+\.){0,5})',
-    ]
-    
-    for pattern in undp_patterns:
-        match = re.search(pattern, first_5000, re.IGNORECASE)
+    # Must be near the beginning of the document (within first 5000 chars;
+    # bounded with endpos rather than by slicing a copy)
+    for pattern in applicable_patterns(UNDP_PATTERNS, content_lower, 'project', 'implementing'):
+        match = search_sentences(pattern, content_lower, 5000)
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 50 and len(cleaned) < 3000:  # Reasonable length
                 return cleaned
@@ -247,17 +573,10 @@ def extract_brief_description(content):
     # PATTERN GROUP 6: GEF PPG "Describe the PPG activities" format
     # ==========================================================================
     
-    ppg_patterns = [
-        # PPG activities and justifications
-        r'Describe\s+the\s+PPG\s+activities\s+and\s+justifications\s*[:\-]?\s*([\s\S]*?)(?=\n\s*(?:List\s+of\s+Proposed|The\s+following\s+provides|Component\s+\d|[A-Z]\.\s+[A-Z]))',
-        # Project title description in PPG
-        r'PROJECT\s+TITLE\s*[:\-]\s*([^\n]+)',
-    ]
-    
-    for pattern in ppg_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in applicable_patterns(PPG_PATTERNS, content_lower, 'ppg', 'title'):
+        match = search_section(pattern, content_lower)
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 50:
                 return cleaned
@@ -266,10 +585,9 @@ def extract_brief_description(content):
     # PATTERN GROUP 7: Situation Analysis intro (fallback for UNDP docs)
     # ==========================================================================
     
-    situation_intro = r'(?:I\.|1\.)\s*SITUATION\s+ANALYSIS\s*\n([\s\S]*?)(?=\n\s*(?:II\.|2\.|Economy|Energy|Agriculture|[A-Z][a-z]+\s*:))'
-    match = re.search(situation_intro, content, re.IGNORECASE)
+    match = search_section(SITUATION_INTRO_PATTERN, content_lower) if 'situation' in content_lower else None
     if match:
-        text = match.group(1)
+        text = original_group(match, content)
         cleaned = clean_text(text)
         if cleaned and len(cleaned) > 100:
             return cleaned
@@ -278,15 +596,10 @@ def extract_brief_description(content):
     # PATTERN GROUP 8: Abstract section (for project reports/brochures)
     # ==========================================================================
     
-    abstract_patterns = [
-        r'\n\s*Abstract\s*\n([\s\S]*?)(?=\n\s*(?:Content|Table\s+of\s+Contents|Introduction|\d+\s+[A-Z]|[A-Z]+\s+[A-Z]+:))',
-        r'\n\s*ABSTRACT\s*\n([\s\S]*?)(?=\n\s*(?:CONTENT|TABLE\s+OF|INTRODUCTION|\d+\s+[A-Z]))',
-    ]
-    
-    for pattern in abstract_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in applicable_patterns(ABSTRACT_PATTERNS, content_lower, 'abstract'):
+        match = search_section(pattern, content_lower)
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 100:
                 return cleaned
@@ -295,17 +608,10 @@ def extract_brief_description(content):
     # PATTERN GROUP 9: Program Vision and Mission / Program Objectives
     # ==========================================================================
     
-    program_patterns = [
-        # Program Vision and Mission section
-        r'Program\s+Vision\s+and\s+Mission\s*\n([\s\S]*?)(?=\n\s*(?:Program\s+Objectives|The\s+\dADI|[A-Z][a-z]+\s+Objectives|\d+\s*\n))',
-        # Program Objectives section
-        r'Program\s+Objectives(?:\s+and\s+Expected\s+Impact)?\s*\n([\s\S]*?)(?=\n\s*(?:For\s+the\s+|Support\s+to|I\.\s+Problem|Table\s+\d))',
-    ]
-    
-    for pattern in program_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in PROGRAM_PATTERNS:
+        match = search_from_prefix(pattern, content_lower, 'program')
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 100:
                 return cleaned
@@ -314,17 +620,13 @@ def extract_brief_description(content):
     # PATTERN GROUP 10: Country Programme Framework intro paragraph
     # ==========================================================================
     
-    cpf_patterns = [
-        # Country Programme Framework intro - typically right after title, before signatures
-        r'COUNTRY\s+PROGRAMME\s+(?:FRAMEWORK|FOR)\s+[^\n]+\n(?:for\s+[^\n]+\n)?(?:INCLUSIVE[^\n]+\n)?(?:\d{4}[^\n]*\n)?([\s\S]*?)(?=\n\s*_{5,}|\n\s*[A-Z][a-z]+\s+[A-Z][a-z]+\s*\n\s*Director)',
-        # Alternative: The [Country] Country Programme Framework... paragraph
-        r'(The\s+[A-Z][a-z]+\s+Country\s+Programme\s+Framework[^.]+\.(?:[^.]+\.){1,10})',
-    ]
-    
-    for pattern in cpf_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in applicable_patterns(CPF_PATTERNS, content_lower, 'country'):
+        if pattern is CPF_SENTENCES_PATTERN:
+            match = search_sentences(pattern, content_lower)
+        else:
+            match = search_section(pattern, content_lower)
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 100 and len(cleaned) < 5000:
                 return cleaned
@@ -333,17 +635,10 @@ def extract_brief_description(content):
     # PATTERN GROUP 11: Value Chain / Support Program description
     # ==========================================================================
     
-    vc_patterns = [
-        # Value Chain Support Program intro
-        r'(?:Value\s+Chain|Support\s+Program)[^\n]*\n(?:Prospective[^\n]*\n)?([\s\S]*?)(?=\n\s*(?:Contents|Table\s+of\s+Contents|Acronyms|\d+\s*\n))',
-        # Country Context as description
-        r'Country\s+Context\s*\n([\s\S]*?)(?=\n\s*(?:The\s+\dADI|Contents|Acronyms|Tables\s+and))',
-    ]
-    
-    for pattern in vc_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in applicable_patterns(VALUE_CHAIN_PATTERNS, content_lower, 'value', 'support', 'context'):
+        match = search_section(pattern, content_lower)
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 100 and len(cleaned) < 5000:
                 return cleaned
@@ -352,19 +647,10 @@ def extract_brief_description(content):
     # PATTERN GROUP 12: One Programme / UN Programme Objective
     # ==========================================================================
     
-    one_programme_patterns = [
-        # "1 Objective of the One Programme" or similar numbered objective
-        r'\d+\s+Objective\s+of\s+the\s+(?:One\s+)?Programme\s*\n([\s\S]*?)(?=\n\s*\d+\s+(?:One\s+)?Programme\s+Structure|\n\s*\d+\.\d+|\n\s*2\s+[A-Z])',
-        # "Objective of the Programme" without number
-        r'Objective\s+of\s+the\s+(?:One\s+)?Programme\s*\n([\s\S]*?)(?=\n\s*(?:Programme\s+Structure|\d+\.\d+|\d+\s+[A-Z]))',
-        # Generic "Programme Objective" section
-        r'Programme\s+Objective[s]?\s*\n([\s\S]*?)(?=\n\s*(?:\d+\s+[A-Z]|\d+\.\d+|Programme\s+Structure))',
-    ]
-    
-    for pattern in one_programme_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in applicable_patterns(ONE_PROGRAMME_PATTERNS, content_lower, 'programme'):
+        match = search_section(pattern, content_lower)
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 50 and len(cleaned) < 5000:
                 return cleaned
@@ -373,19 +659,10 @@ def extract_brief_description(content):
     # PATTERN GROUP 13: Meeting Report / Committee Report Introduction
     # ==========================================================================
     
-    meeting_report_patterns = [
-        # "Introduction" section with numbered paragraphs (like ExCom reports)
-        r'\n\s*Introduction\s*\n((?:\d+\.\s+[\s\S]*?)(?=\n\s*AGENDA\s+ITEM|\n\s*[A-Z]+\s+ITEM|\n\s*\d+\.\s+[A-Z][a-z]+\s+of))',
-        # "REPORT OF THE..." followed by Introduction
-        r'REPORT\s+OF\s+THE\s+[^\n]+\n\s*Introduction\s*\n([\s\S]*?)(?=\n\s*AGENDA\s+ITEM)',
-        # Generic Introduction for reports
-        r'\n\s*Introduction\s*\n([\s\S]*?)(?=\n\s*(?:AGENDA|Contents|Table\s+of|I\.\s+|1\.\s+[A-Z][a-z]+\s+[a-z]))',
-    ]
-    
-    for pattern in meeting_report_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in applicable_patterns(MEETING_REPORT_PATTERNS, content_lower, 'introduction'):
+        match = search_section(pattern, content_lower)
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 100 and len(cleaned) < 10000:
                 return cleaned
@@ -394,21 +671,12 @@ def extract_brief_description(content):
     # PATTERN GROUP 14: Short description field (PRODOC format)
     # ==========================================================================
     
-    short_desc_patterns = [
-        # "The overall objective" paragraph (common in PRODOC header tables)
-        r'Total\s+budget[^\n]*\n(The\s+overall\s+objective[\s\S]*?)(?=\n\s*(?:\d+\s*\n\s*Project|\n\s*Contents|[A-Z]\.\s+[A-Z]))',
-        # "Short description" field in project header
-        r'Short\s+description\s*\n?([\s\S]*?)(?=\n\s*(?:Contents|Table\s+of|[A-Z]\.\s+[A-Z]|\d+\s*\n\s*Project))',
-        # Alternative: Short description followed by section
-        r'Short\s+description\s*[:\n]\s*([\s\S]*?)(?=\n\s*(?:[A-Z]\.\s+[A-Z]|Contents|Background))',
-    ]
-    
-    for pattern in short_desc_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in applicable_patterns(SHORT_DESC_PATTERNS, content_lower, 'overall', 'short'):
+        match = search_section(pattern, content_lower)
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             # Clean up table formatting artifacts like "Short description" in the middle
-            text = re.sub(r'\n\s*Short\s+description\s*\n', '\n', text, flags=re.IGNORECASE)
+            text = SHORT_DESC_LABEL_PATTERN.sub('\n', text)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 50 and len(cleaned) < 5000:
                 return cleaned
@@ -417,17 +685,10 @@ def extract_brief_description(content):
     # PATTERN GROUP 15: Project Purpose / A1. Project Purpose (PRODOC format)
     # ==========================================================================
     
-    project_purpose_patterns = [
-        # "A1. Project Purpose" or "A.1 Project Purpose"
-        r'A\.?\s*1\.?\s*Project\s+Purpose\s*\n([\s\S]*?)(?=\n\s*(?:A\.?\s*2|Figure\s+\d|The\s+project\s+will|The\s+main\s+rationale))',
-        # "Project Purpose" standalone
-        r'\n\s*Project\s+Purpose\s*\n([\s\S]*?)(?=\n\s*(?:[A-Z]\.?\s*\d|Figure|Table|The\s+project))',
-    ]
-    
-    for pattern in project_purpose_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in applicable_patterns(PROJECT_PURPOSE_PATTERNS, content_lower, 'purpose'):
+        match = search_section(pattern, content_lower)
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 100 and len(cleaned) < 10000:
                 return cleaned
@@ -436,17 +697,10 @@ def extract_brief_description(content):
     # PATTERN GROUP 16: PROJECT DESCRIPTION section (ExCom project proposals)
     # ==========================================================================
     
-    project_desc_patterns = [
-        # "PROJECT DESCRIPTION" followed by "Background"
-        r'PROJECT\s+DESCRIPTION\s*\n\s*(?:Background\s*\n)?([\s\S]*?)(?=\n\s*(?:SECRETARIAT|PROJECT\s+EVALUATION|[A-Z]+\s+COSTS|\d+\.\s+On\s+behalf))',
-        # Generic PROJECT DESCRIPTION
-        r'PROJECT\s+DESCRIPTION\s*\n([\s\S]*?)(?=\n\s*(?:[A-Z]{2,}\s+[A-Z]|Table\s+\d|\d+\s*\n\s*[A-Z]))',
-    ]
-    
-    for pattern in project_desc_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in applicable_patterns(PROJECT_DESC_PATTERNS, content_lower, 'description'):
+        match = search_section(pattern, content_lower)
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 100 and len(cleaned) < 15000:
                 return cleaned
@@ -455,19 +709,10 @@ def extract_brief_description(content):
     # PATTERN GROUP 17: Work Programme / Work Plan intro (internal documents)
     # ==========================================================================
     
-    work_plan_patterns = [
-        # "A. Work Programme and Budget" section with intro paragraph
-        r'A\.\s*Work\s+Programme\s+and\s+Budget[^\n]*\n([\s\S]*?)(?=\n\s*(?:This\s+work\s+plan|B\.\s+Planned|The\s+GS\s+inter))',
-        # Work Programme intro paragraph after title - capture "Advancing gender equality..." type intros
-        r'(?:2020\s*[-–]\s*2023|Implementation[^\n]*)\s*\n\s*A\.\s*Work\s+Programme[^\n]*\n(Advancing[\s\S]*?)(?=\n\s*(?:This\s+work\s+programme|The\s+GS))',
-        # Generic work plan intro - paragraphs starting with organizational description
-        r'Work\s+Programme\s+and\s+Budget[^\n]*\n(?:\d{4}[^\n]*\n)?(?:for[^\n]*\n)?([\s\S]*?)(?=\n\s*(?:This\s+work\s+programme|B\.\s+|Table\s+of|Contents))',
-    ]
-    
-    for pattern in work_plan_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in applicable_patterns(WORK_PLAN_PATTERNS, content_lower, 'work'):
+        match = search_section(pattern, content_lower)
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 100 and len(cleaned) < 5000:
                 return cleaned
@@ -476,17 +721,10 @@ def extract_brief_description(content):
     # PATTERN GROUP 18: A. INTRODUCTION section (evaluation/audit work plans)
     # ==========================================================================
     
-    intro_section_patterns = [
-        # "A. INTRODUCTION" with numbered paragraphs
-        r'A\.\s*INTRODUCTION\s*\n([\s\S]*?)(?=\n\s*B\.\s+[A-Z])',
-        # Generic lettered Introduction section
-        r'[A-Z]\.\s*INTRODUCTION\s*\n([\s\S]*?)(?=\n\s*[A-Z]\.\s+[A-Z])',
-    ]
-    
-    for pattern in intro_section_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in applicable_patterns(INTRO_SECTION_PATTERNS, content_lower, 'introduction'):
+        match = search_section(pattern, content_lower)
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 100 and len(cleaned) < 10000:
                 return cleaned
@@ -495,15 +733,10 @@ def extract_brief_description(content):
     # PATTERN GROUP 19: Objectives of the action (EU Grant format) - check BEFORE SUMMARY
     # ==========================================================================
     
-    objectives_patterns = [
-        # "Objectives of the action" in grant forms - capture until Target group
-        r'Objectives?\s+of\s+the\s+action\s*\n([\s\S]*?)(?=\n\s*Target\s+group)',
-    ]
-    
-    for pattern in objectives_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in OBJECTIVES_PATTERNS:
+        match = search_from_prefix(pattern, content_lower, 'objective')
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 50 and len(cleaned) < 3000:
                 return cleaned
@@ -512,17 +745,10 @@ def extract_brief_description(content):
     # PATTERN GROUP 20: SUMMARY section (standalone or numbered)
     # ==========================================================================
     
-    summary_section_patterns = [
-        # Standalone "SUMMARY" section (NOT "SUMMARY OF THE ACTION" which is a table format)
-        r'\n\s*SUMMARY\s*\n([\s\S]*?)(?=\n\s*(?:The\s+proposed|More\s+precisely|Prior\s+to|\d+\.\s+[A-Z]|[A-Z]\.\s+[A-Z]|Table\s+of))',
-        # Summary followed by project description
-        r'\n\s*Summary\s*[:\n]\s*([\s\S]*?)(?=\n\s*(?:\d+\.\s+|[A-Z]\.\s+|Table\s+of|Contents))',
-    ]
-    
-    for pattern in summary_section_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in applicable_patterns(SUMMARY_SECTION_PATTERNS, content_lower, 'summary'):
+        match = search_section(pattern, content_lower)
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 100 and len(cleaned) < 10000:
                 return cleaned
@@ -531,14 +757,10 @@ def extract_brief_description(content):
     # PATTERN GROUP 20: "The application relates to:" pattern
     # ==========================================================================
     
-    application_patterns = [
-        r'The\s+application\s+relates\s+to\s*[:\n]\s*([\s\S]*?)(?=\n\s*(?:Location|Total\s+calculated|Timeframe|Previous))',
-    ]
-    
-    for pattern in application_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in applicable_patterns(APPLICATION_PATTERNS, content_lower, 'application'):
+        match = search_section(pattern, content_lower)
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 50 and len(cleaned) < 3000:
                 return cleaned
@@ -548,16 +770,10 @@ def extract_brief_description(content):
     # ==========================================================================
     
     # Only search in first 6000 chars to avoid matching "brief description" phrases elsewhere
-    header_content = content[:6000]
-    brief_field_patterns = [
-        # "Brief description:" field - capture multiline content until "Approved" or page number
-        r'Brief\s+description\s*:\s*([\s\S]*?)(?=\n\s*(?:\d+\s*\n\s*\n|Approved\s*:|Page\s+\d))',
-    ]
-    
-    for pattern in brief_field_patterns:
-        match = re.search(pattern, header_content, re.IGNORECASE)
+    for pattern in BRIEF_FIELD_PATTERNS:
+        match = search_from_prefix(pattern, content_lower, 'brief', 6000)
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             # Clean double-letter encoding (e.g., "TThhee" -> "The")
             text = clean_double_letter_encoding(text)
             cleaned = clean_text(text)
@@ -568,21 +784,12 @@ def extract_brief_description(content):
     # PATTERN GROUP 22: Preamble before Table of Contents (UNIDO project docs)
     # ==========================================================================
     
-    preamble_patterns = [
-        # Content between "In-kind" and "Approved:" - common UNIDO PRODOC format
-        r'(?:In-kind|Counterpart\s+inputs\s+In-kind)[^\n]*\n(Since[\s\S]*?)(?=\n\s*Approved\s*:)',
-        # Content starting with "Since the signing" before Approved
-        r'\n(Since\s+the\s+signing[\s\S]*?)(?=\n\s*Approved\s*:)',
-        # Content between header info and Approved/Table of Contents
-        r'(?:Executing\s+agency|UNIDO\s+inputs)[^\n]*\n([\s\S]*?)(?=\n\s*(?:Table\s+of\s+Contents|Contents\s*\n|Approved\s*:))',
-    ]
-    
-    for pattern in preamble_patterns:
-        match = re.search(pattern, content[:5000], re.IGNORECASE)  # Only search first 5000 chars
+    for pattern in applicable_patterns(PREAMBLE_PATTERNS, content_lower, 'in-kind', 'since', 'executing', 'unido'):
+        match = search_section(pattern, content_lower, 0, 5000)  # Only search first 5000 chars
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             # Skip if it's just signature blocks or too short
-            if len(text) > 200 and not re.search(r'^[\s\n]*Signature|^[\s\n]*On\s+behalf', text[:100]):
+            if len(text) > 200 and not PREAMBLE_SIGNATURE_PATTERN.search(text, 0, 100):
                 cleaned = clean_text(text)
                 if cleaned and len(cleaned) > 100 and len(cleaned) < 5000:
                     return cleaned
@@ -591,17 +798,10 @@ def extract_brief_description(content):
     # PATTERN GROUP 23: Service Summary Sheet / Origin of proposal
     # ==========================================================================
     
-    service_summary_patterns = [
-        # "Origin of proposal:" section
-        r'Origin\s+of\s+proposal\s*[:\n]\s*([\s\S]*?)(?=\n\s*(?:Problem|Research\s+issue|Objective|Expected))',
-        # Service Summary Sheet intro after title
-        r'Service\s+Summary\s+Sheet\s*\n(?:[^\n]*\n){1,5}([\s\S]*?)(?=\n\s*(?:Problem|SSS-|Page\s+\d))',
-    ]
-    
-    for pattern in service_summary_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in applicable_patterns(SERVICE_SUMMARY_PATTERNS, content_lower, 'origin', 'service'):
+        match = search_section(pattern, content_lower)
         if match:
-            text = match.group(1)
+            text = original_group(match, content)
             cleaned = clean_text(text)
             if cleaned and len(cleaned) > 50 and len(cleaned) < 5000:
                 return cleaned
@@ -609,7 +809,85 @@ def extract_brief_description(content):
     return None
 
 
-def extract_challenges(content):
+# =============================================================================
+# CHALLENGES PATTERNS (compiled once, used by extract_challenges)
+# =============================================================================
+# Lowercase, matched against the lowercased document like the brief description
+# patterns, except the case-sensitive COUNTRY_CHALLENGES_PATTERN.
+
+# Section 1: GEF-specific patterns (highest priority)
+# Pattern GEF-1: GEF CEO Endorsement format
+GEF_CEO_PATTERN = re.compile(r'(?:a\.?\s*)?(?:\d+\.?\s*)?(?:problems?\s+)?(?:to\s+be\s+)?addressed[:\s]*\n([\s\S]*?)(?=\n\s*(?:b\.\s*|root\s+causes|barriers|the\s+proposed|solution|alternative|project\s+objective|\Z))')
+# Pattern GEF-2: Barriers section with numbered barriers (GEF PIF format)
+BARRIERS_HEADER_PATTERN = re.compile(r'\n\s*barriers?\s*\n')
+BARRIERS_SECTION_PATTERN = re.compile(r'\n\s*barriers?\s*\n([\s\S]*?)(?=\n\s*(?:\d+\.\s*[a-z]|root\s+causes|b\.\s*|baseline|project\s+objective|expected|\Z))')
+# Pattern GEF-3: Inline Barrier format "Barrier #1: ..., Barrier #2: ..."
+BARRIER_INLINE_PATTERN = re.compile(r'(barrier\s*#?\s*\d+\s*[:\-][^\n]+(?:\n(?!barrier\s*#?\s*\d+)[^\n]*){0,3})')
+
+# Section 2: Standard PRODOC patterns
+# Pattern PRODOC-1: Standalone "Problem to be addressed:"
+STANDALONE_PROBLEM_PATTERN = re.compile(r'problem(?:s)?\s+to\s+be\s+addressed\s*[:\-]\s*\n([\s\S]*?)(?=\n\s*(?:background|expected\s+target|project\s+objective|unido\s+assistance|rationale|the\s+project|outcomes|\Z))')
+# Pattern PRODOC-2: "THEREFORE, THE PROBLEMS TO BE ADDRESSED ARE:"
+THEREFORE_PROBLEMS_PATTERN = re.compile(r'therefore,?\s+the\s+problems?\s+to\s+be\s+addressed\s+(?:are|is)\s*[:\-]?\s*\n([\s\S]*?)(?=\n\s*(?:[a-z]\.\s*|unido|project\s+objective|expected|the\s+project|\Z))')
+# Pattern PRODOC-3: "B.1 Problems to be addressed"
+B1_PROBLEMS_PATTERN = re.compile(r'b\.?\s*1\.?\s*problems?\s+to\s+be\s+addressed\s*\n([\s\S]*?)(?=\n\s*(?:b\.?\s*2|c\.|project\s+objective|expected|unido|\Z))')
+# Pattern PRODOC-4: "A.1. Problems to be addressed"
+A1_PROBLEMS_PATTERN = re.compile(r'a\.?\s*1\.?\s*problems?\s+to\s+be\s+addressed\s*\n([\s\S]*?)(?=\n\s*(?:a\.?\s*2|b\.|project\s+objective|expected|\Z))')
+# Pattern PRODOC-5: "A.2 CHALLENGES TO BE ADDRESSED" (standard format)
+A2_CHALLENGES_PATTERN = re.compile(r'a\.?\s*2\.?\s*challenges?\s+to\s+be\s+addressed\s*\n([\s\S]*?)(?=\n\s*(?:a\.?\s*3|b\.|project\s+objective|expected|\Z))')
+# Pattern PRODOC-6: "A.2 Problems to be addressed"
+A2_PROBLEMS_PATTERN = re.compile(r'a\.?\s*2\.?\s*problems?\s+to\s+be\s+addressed\s*\n([\s\S]*?)(?=\n\s*(?:a\.?\s*3|b\.|project\s+objective|expected|\Z))')
+
+# Section 3: Keyword-conditional patterns
+# Pattern COND-1: Situation Analysis with problem keywords
+SITUATION_ANALYSIS_PATTERN = re.compile(r'(?:\d+\.?\s*)?situation\s+analysis\s*\n([\s\S]*?)(?=\n\s*(?:\d+\.\s*[a-z]|project\s+objective|expected|rationale|the\s+project|\Z))')
+SITUATION_KEYWORDS = ('unemployment', 'poverty', 'constraint', 'challenge',
+                      'problem', 'crisis', 'lack of', 'deficit', 'obstacle',
+                      'difficulty', 'barrier', 'gap', 'weakness', 'threat')
+# Pattern COND-2: Background section with crisis keywords
+BACKGROUND_CRISIS_PATTERN = re.compile(r'(?:a\.?\s*)?background\s*\n([\s\S]*?)(?=\n\s*(?:b\.|problem|challenge|objective|expected|rationale|\Z))')
+CRISIS_KEYWORDS = ('civil war', 'crisis', 'destroy', 'devastate', 'lack of',
+                   'shortage', 'inadequate', 'insufficient', 'gap in',
+                   'problem', 'challenge', 'constrain', 'poverty', 'conflict')
+# Pattern COND-3: "REASONS FOR UNIDO ASSISTANCE" with problem keywords
+REASONS_UNIDO_PATTERN = re.compile(r'(?:b\.?\s*)?reasons?\s+for\s+unido\s+assistance\s*\n([\s\S]*?)(?=\n\s*(?:c\.|project\s+objective|expected|implementation|\Z))')
+REASONS_KEYWORDS = ('lack of', 'problem', 'challenge', 'constraint', 'need to',
+                    'urgent', 'limited', 'inadequate', 'insufficient', 'gap')
+
+# Section 4: MLF/Montreal Protocol patterns (lower priority)
+# Pattern MLF-1: Brief description with problem keywords (Project Summary format)
+MLF_BRIEF_DESC_PATTERN = re.compile(r'brief\s+description\s+of\s+the\s+project\s*[:\-]?\s*\n([\s\S]*?)(?=\n\s*(?:project\s+objective|expected\s+results|beneficiaries|reason\s+for|institutional|budget|\Z))')
+MLF_BRIEF_KEYWORDS = ('challenge', 'problem', 'need', 'lack', 'vulnerability',
+                      'risk', 'resilience', 'poverty', 'constraint', 'climate change',
+                      'impact', 'degradation', 'threat', 'crisis', 'gap', 'deficit')
+# Pattern MLF-2: Reason for UNIDO assistance (Project Summary format)
+REASON_ASSISTANCE_PATTERN = re.compile(r'reason\s+for\s+unido\s+assistance\s*\n([\s\S]*?)(?=\n\s*(?:institutional\s+arrangements|coordination|budget|monitoring|\Z))')
+# Pattern MLF-3: Country challenges context (IS Project Concepts)
+COUNTRY_CHALLENGES_PATTERN = re.compile(r'([A-Z][a-z]+\s+has\s+passed\s+through\s+challenges[^\n]*(?:\n(?![A-Z]\.|\d+\.\s+[A-Z])[^\n]*){0,5})')
+# Pattern MLF-4: Leakage/equipment issues with problem context
+LEAKAGE_ISSUES_PATTERN = re.compile(r'((?:the\s+)?leakage\s+rate\s+is\s+estimated[^\n]*(?:\n(?!table|\d+\.)[^\n]*){0,3})')
+LEAKAGE_KEYWORDS = ('breakdown', 'fluctuation', 'failure', 'servicing')
+# Pattern MLF-5: Background with development context (non-MLF docs)
+BACKGROUND_DEV_PATTERN = re.compile(r'(?:^|\n)background\s*\n([\s\S]*?)(?=\n\s*(?:development\s+goal|overall\s+project\s+objective|component\s+\d|the\s+next\s+phase|\Z))')
+DEV_KEYWORDS = ('poverty', 'youth', 'employment', 'unemployment', 'challenge',
+                'problem', 'need', 'lack', 'informal', 'constraint', 'emerging',
+                'economic growth', 'enterprise', 'entrepreneur', 'capacity')
+
+# Section 5: Generic fallback patterns (lowest priority)
+# Pattern GENERIC-1: Context section with challenge bullet points
+CONTEXT_CHALLENGES_PATTERN = re.compile(r'(?:context|introduction|overview)\s*\n([\s\S]*?)(?=\n\s*(?:objective|strategy|approach|\Z))')
+CONTEXT_KEYWORDS = ('challenge', 'problem', 'lack', 'need', 'gap')
+# Pattern GENERIC-2: Numbered problem list
+NUMBERED_PROBLEMS_PATTERN = re.compile(r'(\d+\.\s*(?:the\s+)?(?:main\s+)?(?:problem|challenge|issue|constraint)[^\n]+)')
+
+
+def has_keyword(text, keywords):
+    """Return True if any of the (lowercase) keywords occurs in text, ignoring case."""
+    text = text.lower()
+    return any(kw in text for kw in keywords)
+
+
+def extract_challenges(content, content_lower=None):
     """
     Extract challenges/problem statements from UNIDO project documents.
     
@@ -621,6 +899,7 @@ def extract_challenges(content):
     
     Args:
         content: String containing the full text of the project document
+        content_lower: lower_for_matching(content), if the caller already has it
         
     Returns:
         String containing extracted challenges/problems, or None if not found
@@ -628,40 +907,35 @@ def extract_challenges(content):
     if not content:
         return None
     
+    # Patterns run on the lowercased copy; patterns whose header words do not
+    # occur are skipped
+    if content_lower is None:
+        content_lower = lower_for_matching(content)
+    
     # =========================================================================
     # SECTION 1: GEF-SPECIFIC PATTERNS (Highest Priority)
     # =========================================================================
     
     # Pattern GEF-1: GEF CEO Endorsement format
-    gef_ceo = re.search(
-        r'(?:A\.?\s*)?(?:\d+\.?\s*)?(?:Problems?\s+)?(?:to\s+be\s+)?addressed[:\s]*\n([\s\S]*?)(?=\n\s*(?:B\.\s*|Root\s+causes|Barriers|The\s+proposed|Solution|Alternative|Project\s+Objective|\Z))',
-        content,
-        re.IGNORECASE
-    )
+    gef_ceo = search_section(GEF_CEO_PATTERN, content_lower) if 'addressed' in content_lower else None
     if gef_ceo:
-        text = gef_ceo.group(1).strip()
+        text = original_group(gef_ceo, content).strip()
         if len(text) > 100:
             return text
     
     # Pattern GEF-2: Barriers section with numbered barriers (GEF PIF format)
-    barriers_header = re.search(r'\n\s*Barriers?\s*\n', content, re.IGNORECASE)
+    barriers_header = BARRIERS_HEADER_PATTERN.search(content_lower) if 'barrier' in content_lower else None
     if barriers_header:
-        barriers_content = re.search(
-            r'\n\s*Barriers?\s*\n([\s\S]*?)(?=\n\s*(?:\d+\.\s*[A-Z]|Root\s+causes|B\.\s*|Baseline|Project\s+Objective|Expected|\Z))',
-            content,
-            re.IGNORECASE
-        )
+        barriers_content = search_section(BARRIERS_SECTION_PATTERN, content_lower)
         if barriers_content:
-            text = barriers_content.group(1).strip()
+            text = original_group(barriers_content, content).strip()
             if len(text) > 50:
                 return text
     
     # Pattern GEF-3: Inline Barrier format "Barrier #1: ..., Barrier #2: ..."
-    barrier_inline = re.findall(
-        r'(Barrier\s*#?\s*\d+\s*[:\-][^\n]+(?:\n(?!Barrier\s*#?\s*\d+)[^\n]*){0,3})',
-        content,
-        re.IGNORECASE
-    )
+    barrier_inline = []
+    if 'barrier' in content_lower:
+        barrier_inline = [original_group(m, content) for m in BARRIER_INLINE_PATTERN.finditer(content_lower)]
     if barrier_inline and len(barrier_inline) >= 2:
         return '\n\n'.join(barrier_inline)
     
@@ -670,68 +944,44 @@ def extract_challenges(content):
     # =========================================================================
     
     # Pattern PRODOC-1: Standalone "Problem to be addressed:" 
-    standalone_problem = re.search(
-        r'Problem(?:s)?\s+to\s+be\s+addressed\s*[:\-]\s*\n([\s\S]*?)(?=\n\s*(?:Background|Expected\s+target|Project\s+Objective|UNIDO\s+assistance|Rationale|The\s+project|Outcomes|\Z))',
-        content,
-        re.IGNORECASE
-    )
+    standalone_problem = search_from_prefix(STANDALONE_PROBLEM_PATTERN, content_lower, 'problem')
     if standalone_problem:
-        text = standalone_problem.group(1).strip()
+        text = original_group(standalone_problem, content).strip()
         if len(text) > 50:
             return text
     
     # Pattern PRODOC-2: "THEREFORE, THE PROBLEMS TO BE ADDRESSED ARE:"
-    therefore_problems = re.search(
-        r'THEREFORE,?\s+THE\s+PROBLEMS?\s+TO\s+BE\s+ADDRESSED\s+(?:ARE|IS)\s*[:\-]?\s*\n([\s\S]*?)(?=\n\s*(?:[A-Z]\.\s*|UNIDO|Project\s+Objective|Expected|The\s+project|\Z))',
-        content,
-        re.IGNORECASE
-    )
+    therefore_problems = search_from_prefix(THEREFORE_PROBLEMS_PATTERN, content_lower, 'therefore')
     if therefore_problems:
-        text = therefore_problems.group(1).strip()
+        text = original_group(therefore_problems, content).strip()
         if len(text) > 50:
             return text
     
     # Pattern PRODOC-3: "B.1 Problems to be addressed"
-    b1_problems = re.search(
-        r'B\.?\s*1\.?\s*Problems?\s+to\s+be\s+addressed\s*\n([\s\S]*?)(?=\n\s*(?:B\.?\s*2|C\.|Project\s+Objective|Expected|UNIDO|\Z))',
-        content,
-        re.IGNORECASE
-    )
+    b1_problems = search_section(B1_PROBLEMS_PATTERN, content_lower) if 'addressed' in content_lower else None
     if b1_problems:
-        text = b1_problems.group(1).strip()
+        text = original_group(b1_problems, content).strip()
         if len(text) > 50:
             return text
     
     # Pattern PRODOC-4: "A.1. Problems to be addressed"
-    a1_problems = re.search(
-        r'A\.?\s*1\.?\s*Problems?\s+to\s+be\s+addressed\s*\n([\s\S]*?)(?=\n\s*(?:A\.?\s*2|B\.|Project\s+Objective|Expected|\Z))',
-        content,
-        re.IGNORECASE
-    )
+    a1_problems = search_section(A1_PROBLEMS_PATTERN, content_lower) if 'addressed' in content_lower else None
     if a1_problems:
-        text = a1_problems.group(1).strip()
+        text = original_group(a1_problems, content).strip()
         if len(text) > 50:
             return text
     
     # Pattern PRODOC-5: "A.2 CHALLENGES TO BE ADDRESSED" (standard format)
-    a2_challenges = re.search(
-        r'A\.?\s*2\.?\s*CHALLENGES?\s+TO\s+BE\s+ADDRESSED\s*\n([\s\S]*?)(?=\n\s*(?:A\.?\s*3|B\.|Project\s+Objective|Expected|\Z))',
-        content,
-        re.IGNORECASE
-    )
+    a2_challenges = search_section(A2_CHALLENGES_PATTERN, content_lower) if 'addressed' in content_lower else None
     if a2_challenges:
-        text = a2_challenges.group(1).strip()
+        text = original_group(a2_challenges, content).strip()
         if len(text) > 50:
             return text
     
     # Pattern PRODOC-6: "A.2 Problems to be addressed"
-    a2_problems = re.search(
-        r'A\.?\s*2\.?\s*Problems?\s+to\s+be\s+addressed\s*\n([\s\S]*?)(?=\n\s*(?:A\.?\s*3|B\.|Project\s+Objective|Expected|\Z))',
-        content,
-        re.IGNORECASE
-    )
+    a2_problems = search_section(A2_PROBLEMS_PATTERN, content_lower) if 'addressed' in content_lower else None
     if a2_problems:
-        text = a2_problems.group(1).strip()
+        text = original_group(a2_problems, content).strip()
         if len(text) > 50:
             return text
     
@@ -740,44 +990,24 @@ def extract_challenges(content):
     # =========================================================================
     
     # Pattern COND-1: Situation Analysis with problem keywords
-    situation_analysis = re.search(
-        r'(?:\d+\.?\s*)?Situation\s+Analysis\s*\n([\s\S]*?)(?=\n\s*(?:\d+\.\s*[A-Z]|Project\s+Objective|Expected|Rationale|The\s+project|\Z))',
-        content,
-        re.IGNORECASE
-    )
+    situation_analysis = search_section(SITUATION_ANALYSIS_PATTERN, content_lower) if 'situation' in content_lower else None
     if situation_analysis:
-        text = situation_analysis.group(1).strip()
-        problem_keywords = ['unemployment', 'poverty', 'constraint', 'challenge', 
-                          'problem', 'crisis', 'lack of', 'deficit', 'obstacle',
-                          'difficulty', 'barrier', 'gap', 'weakness', 'threat']
-        if any(kw in text.lower() for kw in problem_keywords) and len(text) > 200:
+        text = original_group(situation_analysis, content).strip()
+        if len(text) > 200 and has_keyword(text, SITUATION_KEYWORDS):
             return text
     
     # Pattern COND-2: Background section with crisis keywords
-    background_crisis = re.search(
-        r'(?:A\.?\s*)?Background\s*\n([\s\S]*?)(?=\n\s*(?:B\.|Problem|Challenge|Objective|Expected|Rationale|\Z))',
-        content,
-        re.IGNORECASE
-    )
+    background_crisis = search_section(BACKGROUND_CRISIS_PATTERN, content_lower) if 'background' in content_lower else None
     if background_crisis:
-        text = background_crisis.group(1).strip()
-        crisis_keywords = ['civil war', 'crisis', 'destroy', 'devastate', 'lack of',
-                         'shortage', 'inadequate', 'insufficient', 'gap in', 
-                         'problem', 'challenge', 'constrain', 'poverty', 'conflict']
-        if any(kw in text.lower() for kw in crisis_keywords) and len(text) > 300:
+        text = original_group(background_crisis, content).strip()
+        if len(text) > 300 and has_keyword(text, CRISIS_KEYWORDS):
             return text
     
     # Pattern COND-3: "REASONS FOR UNIDO ASSISTANCE" with problem keywords
-    reasons_unido = re.search(
-        r'(?:B\.?\s*)?REASONS?\s+FOR\s+UNIDO\s+ASSISTANCE\s*\n([\s\S]*?)(?=\n\s*(?:C\.|Project\s+Objective|Expected|Implementation|\Z))',
-        content,
-        re.IGNORECASE
-    )
+    reasons_unido = search_section(REASONS_UNIDO_PATTERN, content_lower) if 'reason' in content_lower else None
     if reasons_unido:
-        text = reasons_unido.group(1).strip()
-        problem_keywords = ['lack of', 'problem', 'challenge', 'constraint', 'need to',
-                          'urgent', 'limited', 'inadequate', 'insufficient', 'gap']
-        if any(kw in text.lower() for kw in problem_keywords) and len(text) > 200:
+        text = original_group(reasons_unido, content).strip()
+        if len(text) > 200 and has_keyword(text, REASONS_KEYWORDS):
             return text
     
     # =========================================================================
@@ -787,61 +1017,37 @@ def extract_challenges(content):
     # "challenges" sections. They capture available contextual information.
     
     # Pattern MLF-1: Brief description with problem keywords (Project Summary format)
-    brief_desc = re.search(
-        r'Brief\s+description\s+of\s+the\s+project\s*[:\-]?\s*\n([\s\S]*?)(?=\n\s*(?:Project\s+objective|Expected\s+results|Beneficiaries|Reason\s+for|Institutional|Budget|\Z))',
-        content,
-        re.IGNORECASE
-    )
+    brief_desc = search_from_prefix(MLF_BRIEF_DESC_PATTERN, content_lower, 'brief')
     if brief_desc:
-        text = brief_desc.group(1).strip()
-        problem_keywords = ['challenge', 'problem', 'need', 'lack', 'vulnerability', 
-                          'risk', 'resilience', 'poverty', 'constraint', 'climate change',
-                          'impact', 'degradation', 'threat', 'crisis', 'gap', 'deficit']
-        if any(kw in text.lower() for kw in problem_keywords):
+        text = original_group(brief_desc, content).strip()
+        if has_keyword(text, MLF_BRIEF_KEYWORDS):
             return text
     
     # Pattern MLF-2: Reason for UNIDO assistance (Project Summary format)
-    reason_assistance = re.search(
-        r'Reason\s+for\s+UNIDO\s+assistance\s*\n([\s\S]*?)(?=\n\s*(?:Institutional\s+arrangements|Coordination|Budget|Monitoring|\Z))',
-        content,
-        re.IGNORECASE
-    )
+    reason_assistance = search_from_prefix(REASON_ASSISTANCE_PATTERN, content_lower, 'reason')
     if reason_assistance:
-        text = reason_assistance.group(1).strip()
+        text = original_group(reason_assistance, content).strip()
         if len(text) > 100:
             return text
     
     # Pattern MLF-3: Country challenges context (IS Project Concepts)
-    country_challenges = re.search(
-        r'([A-Z][a-z]+\s+has\s+passed\s+through\s+challenges[^\n]*(?:\n(?![A-Z]\.|\d+\.\s+[A-Z])[^\n]*){0,5})',
-        content
-    )
+    # (case-sensitive, so it runs on the original text)
+    country_challenges = COUNTRY_CHALLENGES_PATTERN.search(content) if 'passed' in content_lower else None
     if country_challenges:
         return country_challenges.group(1).strip()
     
     # Pattern MLF-4: Leakage/equipment issues with problem context
-    leakage_issues = re.search(
-        r'((?:The\s+)?leakage\s+rate\s+is\s+estimated[^\n]*(?:\n(?!Table|\d+\.)[^\n]*){0,3})',
-        content,
-        re.IGNORECASE
-    )
+    leakage_issues = search_section(LEAKAGE_ISSUES_PATTERN, content_lower) if 'leakage' in content_lower else None
     if leakage_issues:
-        text = leakage_issues.group(1).strip()
-        if any(kw in text.lower() for kw in ['breakdown', 'fluctuation', 'failure', 'servicing']):
+        text = original_group(leakage_issues, content).strip()
+        if has_keyword(text, LEAKAGE_KEYWORDS):
             return text
     
     # Pattern MLF-5: Background with development context (non-MLF docs)
-    background_dev = re.search(
-        r'(?:^|\n)Background\s*\n([\s\S]*?)(?=\n\s*(?:Development\s+goal|Overall\s+project\s+objective|Component\s+\d|The\s+next\s+phase|\Z))',
-        content,
-        re.IGNORECASE
-    )
+    background_dev = search_section(BACKGROUND_DEV_PATTERN, content_lower) if 'background' in content_lower else None
     if background_dev:
-        text = background_dev.group(1).strip()
-        dev_keywords = ['poverty', 'youth', 'employment', 'unemployment', 'challenge', 
-                       'problem', 'need', 'lack', 'informal', 'constraint', 'emerging',
-                       'economic growth', 'enterprise', 'entrepreneur', 'capacity']
-        if any(kw in text.lower() for kw in dev_keywords) and len(text) > 300:
+        text = original_group(background_dev, content).strip()
+        if len(text) > 300 and has_keyword(text, DEV_KEYWORDS):
             return text
     
     # =========================================================================
@@ -849,62 +1055,123 @@ def extract_challenges(content):
     # =========================================================================
     
     # Pattern GENERIC-1: Context section with challenge bullet points
-    context_challenges = re.search(
-        r'(?:Context|Introduction|Overview)\s*\n([\s\S]*?)(?=\n\s*(?:Objective|Strategy|Approach|\Z))',
-        content,
-        re.IGNORECASE
-    )
+    context_challenges = None
+    if any(anchor in content_lower for anchor in ('context', 'introduction', 'overview')):
+        context_challenges = search_section(CONTEXT_CHALLENGES_PATTERN, content_lower)
     if context_challenges:
-        text = context_challenges.group(1).strip()
+        text = original_group(context_challenges, content).strip()
         # Check for bullet points with challenge language
-        if (('•' in text or '-' in text or '*' in text) and 
-            any(kw in text.lower() for kw in ['challenge', 'problem', 'lack', 'need', 'gap'])):
+        if ('•' in text or '-' in text or '*' in text) and has_keyword(text, CONTEXT_KEYWORDS):
             return text
     
     # Pattern GENERIC-2: Numbered problem list
-    numbered_problems = re.findall(
-        r'(\d+\.\s*(?:The\s+)?(?:main\s+)?(?:problem|challenge|issue|constraint)[^\n]+)',
-        content,
-        re.IGNORECASE
-    )
+    numbered_problems = []
+    if any(anchor in content_lower for anchor in ('problem', 'challenge', 'issue', 'constraint')):
+        numbered_problems = [original_group(m, content) for m in NUMBERED_PROBLEMS_PATTERN.finditer(content_lower)]
     if numbered_problems and len(numbered_problems) >= 2:
         return '\n'.join(numbered_problems)
     
     return None
 
 
-def extract_all_challenges_sections(content):
+# =============================================================================
+# FALLBACK CHALLENGES PATTERNS (used by extract_all_challenges_sections)
+# =============================================================================
+
+# Lowercase, matched against the lowercased document like the patterns above
+
+# Numbered subsections under A.2, kept if they contain a challenge keyword
+A2_SUBSECTION_PATTERN = re.compile(r'(a\.?\s*2\.?\s*\d+[^\n]*\n[\s\S]*?)(?=\na\.?\s*2\.?\s*\d+|\na\.?\s*3|\nb\.)')
+CHALLENGE_KEYWORDS = ('challeng', 'problem', 'constraint', 'difficult', 'impediment', 'obstacle', 'issue', 'barrier')
+KEY_CHALLENGES_PATTERN = re.compile(r'(?:key|main|major)\s+(?:challenges?|problems?|constraints?)')
+# Words every paragraph KEY_CHALLENGES_PATTERN accepts contains; like the
+# keywords above, if none occurs in the document the scan is skipped
+KEY_CHALLENGES_ANCHORS = ('challenge', 'problem', 'constraint')
+
+
+def paragraph_bounds(text, start, end):
+    """
+    Return the bounds of the text.split('\n\n') piece that contains
+    text[start:end], which must not start or end with a newline.
+    
+    In a run of newlines split() takes the separators in pairs from the left,
+    so with an odd run the last newline begins the next piece.
+    """
+    sep = text.rfind('\n\n', 0, start)
+    if sep < 0:
+        para_start = 0
+    else:
+        # sep is the last pair of the run before start; find where the run began
+        run_start = sep
+        while run_start > 0 and text[run_start - 1] == '\n':
+            run_start -= 1
+        para_start = run_start + (sep + 2 - run_start) // 2 * 2
+    para_end = text.find('\n\n', end)
+    if para_end < 0:
+        para_end = len(text)
+    return para_start, para_end
+
+
+def extract_all_challenges_sections(content, content_lower=None):
     """
     Fallback: Extract any sections that might contain challenge information.
     NO CHARACTER LIMITS.
     """
     challenges = []
+    if content_lower is None:
+        content_lower = lower_for_matching(content)
     
     # Look for numbered subsections under A.2
-    subsection_pattern = r'(A\.?\s*2\.?\s*\d+[^\n]*\n[\s\S]*?)(?=\nA\.?\s*2\.?\s*\d+|\nA\.?\s*3|\nB\.)'
-    matches = re.finditer(subsection_pattern, content, re.IGNORECASE)
-    for match in matches:
-        text = match.group(1)
-        # Check if it contains challenge-related keywords
-        if re.search(r'challeng|problem|constraint|difficult|impediment|obstacle|issue|barrier', text, re.IGNORECASE):
-            cleaned = clean_text(text)
-            if cleaned and len(cleaned) > 100:
-                challenges.append(cleaned)
-    
-    # Also look for any paragraph containing challenge keywords
-    if not challenges:
-        paragraphs = content.split('\n\n')
-        for para in paragraphs:
-            if re.search(r'(?:key|main|major)\s+(?:challenges?|problems?|constraints?)', para, re.IGNORECASE):
-                cleaned = clean_text(para)
+    if any(kw in content_lower for kw in CHALLENGE_KEYWORDS):
+        for match in A2_SUBSECTION_PATTERN.finditer(content_lower):
+            # Check if it contains challenge-related keywords
+            if any(kw in match.group(1) for kw in CHALLENGE_KEYWORDS):
+                cleaned = clean_text(original_group(match, content))
                 if cleaned and len(cleaned) > 100:
                     challenges.append(cleaned)
     
+    # Also look for any paragraph (content.split('\n\n') piece) containing
+    # challenge keywords: one scan of the whole document, expanding each hit to
+    # its paragraph, instead of splitting it and searching every paragraph
+    if not challenges and any(anchor in content_lower for anchor in KEY_CHALLENGES_ANCHORS):
+        para_end = -1
+        for match in KEY_CHALLENGES_PATTERN.finditer(content_lower):
+            # Skip further hits in the same paragraph, and hits that run across
+            # a paragraph break (no hit within one paragraph can overlap those)
+            if match.start() < para_end or '\n\n' in match.group():
+                continue
+            para_start, para_end = paragraph_bounds(content_lower, match.start(), match.end())
+            cleaned = clean_text(content[para_start:para_end])
+            if cleaned and len(cleaned) > 100:
+                challenges.append(cleaned)
+    
     if challenges:
         return '\n\n'.join(challenges)
     return None
 
 
+def read_text_file(filepath):
+    """
+    Read a whole file as UTF-8 text (undecodable bytes dropped) straight from
+    the file descriptor, without the buffered/text IO layers. Line endings are
+    left as-is.
+    """
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while True:
+            # A single read may return less than asked for (or the file may
+            # have grown), so keep reading until EOF
+            chunk = os.read(fd, max(size, 1 << 16))
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b''.join(chunks).decode('utf-8', errors='ignore')
+
+
 def process_document(filepath):
     """
     Process a single document and extract required information.
@@ -918,28 +1185,30 @@ def process_document(filepath):
     # Convert to Path if needed
     if isinstance(filepath, str):
         filepath = Path(filepath)
+    project_id = extract_project_id(filepath)
     
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        content = read_text_file(filepath)
     except Exception as e:
         return {
-            'project_id': extract_project_id(filepath),
+            'project_id': project_id,
             'brief_description': None,
             'challenges_problem_statements': None,
             'error': f"Failed to read file: {str(e)}"
         }
     
     # Normalize line endings
-    content = content.replace('\r\n', '\n').replace('\r', '\n')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
     
-    project_id = extract_project_id(filepath)
-    brief_description = extract_brief_description(content)
+    # Lowercased once for all the pattern matching below
+    content_lower = lower_for_matching(content)
+    brief_description = extract_brief_description(content, content_lower)
     
     # Try multiple approaches for challenges
-    challenges = extract_challenges(content)
+    challenges = extract_challenges(content, content_lower)
     if not challenges:
-        challenges = extract_all_challenges_sections(content)
+        challenges = extract_all_challenges_sections(content, content_lower)
     
     return {
         'project_id': project_id,
@@ -948,6 +1217,21 @@ def process_document(filepath):
     }
 
 
+# Files handed to a worker process per task by main()
+PROCESS_CHUNK_SIZE = 16
+
+
+def process_document_or_error(filepath):
+    """
+    Worker-side process_document(): returns (result, None), or (None, exception)
+    if it raised, so one bad file does not abort the whole executor.map().
+    """
+    try:
+        return process_document(filepath), None
+    except Exception as e:
+        return None, e
+
+
 def main():
     """
     Main function to process all documents.
@@ -986,6 +1270,9 @@ Examples:
   
   # Verbose mode (show details for each file)
   python docs/text/extract_project_info.py --verbose
+  
+  # Limit the number of worker processes
+  python docs/text/extract_project_info.py --workers 4
         """
     )
     
@@ -997,6 +1284,8 @@ Examples:
                         help=f'Output JSON file path (default: {default_output_file})')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Print detailed progress for each file')
+    parser.add_argument('--workers', '-w', type=int, default=None,
+                        help='Number of worker processes (default: number of CPUs)')
     
     args = parser.parse_args()
     
@@ -1013,8 +1302,15 @@ Examples:
         print(f"Error: Input path is not a directory: {input_dir}")
         return
     
-    # Find all txt files
-    txt_files = sorted(list(input_dir.glob('*.txt')))  # Sort for consistent processing
+    # Find all txt files: one scandir pass, sorting plain names (case-insensitive
+    # where the OS is, like glob and Path ordering) before building Paths
+    with os.scandir(input_dir) as entries:
+        txt_names = [
+            entry.name for entry in entries
+            if os.path.normcase(entry.name).endswith('.txt') and entry.is_file()
+        ]
+    txt_names.sort(key=os.path.normcase)  # Sort for consistent processing
+    txt_files = [input_dir / name for name in txt_names]
     
     if not txt_files:
         print(f"No .txt files found in {input_dir}")
@@ -1034,50 +1330,63 @@ Examples:
     challenges_found = 0
     error_count = 0  # Track errors
     
-    for i, filepath in enumerate(txt_files, 1):
-        if verbose or i % 100 == 0:
-            print(f"Processing [{i}/{len(txt_files)}]: {filepath.name}")
+    # Documents are independent and extraction is CPU-bound regex work, so they
+    # are processed in parallel across processes; results are collected in file
+    # order so the output stays the same as a sequential run. Files are handed
+    # to the workers in chunks to cut per-task IPC overhead.
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        outcomes = executor.map(process_document_or_error, txt_files, chunksize=PROCESS_CHUNK_SIZE)
         
-        try:
-            result = process_document(filepath)  # Pass Path object
-            results.append(result)
-            
-            if 'error' not in result:
-                success_count += 1
-                if result['brief_description']:
-                    brief_found += 1
-                if result['challenges_problem_statements']:
-                    challenges_found += 1
-            else:
-                error_count += 1  # Increment error count
+        for i, (filepath, (result, error)) in enumerate(zip(txt_files, outcomes), 1):
+            if verbose or i % 100 == 0:
+                print(f"Processing [{i}/{len(txt_files)}]: {filepath.name}")
             
-            if verbose:
-                print(f"  - Project ID: {result['project_id']}")
-                if 'error' in result:
-                    print(f"  - Error: {result['error']}")
+            try:
+                if error is not None:
+                    raise error
+                results.append(result)
+                
+                if 'error' not in result:
+                    success_count += 1
+                    if result['brief_description']:
+                        brief_found += 1
+                    if result['challenges_problem_statements']:
+                        challenges_found += 1
                 else:
-                    brief_len = len(result['brief_description'] or '')
-                    chall_len = len(result['challenges_problem_statements'] or '')
-                    print(f"  - Brief Description: {'Found' if result['brief_description'] else 'Not found'} ({brief_len} chars)")
-                    print(f"  - Challenges: {'Found' if result['challenges_problem_statements'] else 'Not found'} ({chall_len} chars)")
-        
-        except Exception as e:
-            error_count += 1  # Increment error count for unexpected exceptions
-            print(f"  ✗ Unexpected error processing {filepath.name}: {e}")
-            results.append({
-                'project_id': extract_project_id(filepath),
-                'brief_description': None,
-                'challenges_problem_statements': None,
-                'error': str(e)
-            })
+                    error_count += 1  # Increment error count
+                
+                if verbose:
+                    # One print (one write/flush on a terminal) per file
+                    details = [f"  - Project ID: {result['project_id']}"]
+                    if 'error' in result:
+                        details.append(f"  - Error: {result['error']}")
+                    else:
+                        brief_len = len(result['brief_description'] or '')
+                        chall_len = len(result['challenges_problem_statements'] or '')
+                        details.append(f"  - Brief Description: {'Found' if result['brief_description'] else 'Not found'} ({brief_len} chars)")
+                        details.append(f"  - Challenges: {'Found' if result['challenges_problem_statements'] else 'Not found'} ({chall_len} chars)")
+                    print('\n'.join(details))
+            
+            except Exception as e:
+                error_count += 1  # Increment error count for unexpected exceptions
+                print(f"  ✗ Unexpected error processing {filepath.name}: {e}")
+                results.append({
+                    'project_id': extract_project_id(filepath),
+                    'brief_description': None,
+                    'challenges_problem_statements': None,
+                    'error': str(e)
+                })
     
     # Ensure output directory exists
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
     # Write results to JSON file
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            output_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
         print(f"\n✓ Results saved to: {output_file}")
     except Exception as e:
         print(f"\n✗ Error saving results: {e}")